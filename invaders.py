@@ -8,9 +8,231 @@
 Imports the the game demo and executes the main function.
 """
 
+import argparse
+import os
 import sys
+import assets
+import capture
+import framebuffer
 import game
+import profiler
+import replay
+import scores
+
+
+def parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Play Space Invaders.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulate the battle without a window, as fast as possible",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=None,
+        help="stop a headless run after this many simulated frames",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each phase of the game loop and print a summary on exit",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="simulated seconds per wall-clock second; p pauses, n steps, "
+        "- and = halve and double it while playing",
+    )
+    parser.add_argument(
+        "--fast-forward",
+        action="store_true",
+        help="start simulating as fast as possible, drawing now and then (f toggles)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed the battle's random numbers for a reproducible game",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="write the input of every frame and periodic keyframes to FILE",
+    )
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=replay.KEYFRAME_INTERVAL,
+        help="frames between the keyframes written by --record",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="play back the input recorded in FILE instead of the keyboard",
+    )
+    parser.add_argument(
+        "--view",
+        metavar="FILE",
+        help="watch the replay in FILE with pause, stepping and seeking",
+    )
+    parser.add_argument(
+        "--seek",
+        type=int,
+        default=0,
+        metavar="FRAME",
+        help="start --view at this frame",
+    )
+    parser.add_argument(
+        "--capture",
+        metavar="PATH",
+        help="stream every rendered frame to PATH on a background thread",
+    )
+    parser.add_argument(
+        "--capture-format",
+        choices=capture.FORMATS,
+        default="zlib",
+        help="raw or zlib frames in one file, or a directory of PNGs (default: zlib)",
+    )
+    parser.add_argument(
+        "--shared-frames",
+        nargs="?",
+        const=framebuffer.DEFAULT_NAME,
+        metavar="NAME",
+        help="publish every rendered frame to the shared memory ring NAME "
+        f"(default: {framebuffer.DEFAULT_NAME})",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=None,
+        help="stress test with this many rows of aliens, packed to fit",
+    )
+    parser.add_argument(
+        "--cols",
+        type=int,
+        default=None,
+        help="stress test with this many columns of aliens, packed to fit",
+    )
+    parser.add_argument(
+        "--scores",
+        default=scores.DEFAULT_PATH,
+        metavar="FILE",
+        help=f"SQLite database every finished game is added to (default: {scores.DEFAULT_PATH})",
+    )
+    parser.add_argument(
+        "--leaderboard",
+        choices=("all", "week", "day"),
+        help="print the ten best scores of all time, this week or today and exit",
+    )
+    return parser.parse_args()
+
+
+def open_score_store(path):
+    """Open the score database, importing the old scores.pickle into a new one."""
+    store = scores.ScoreStore(path)
+    if store.is_empty() and os.path.exists(scores.LEGACY_PATH):
+        store.import_pickle(scores.LEGACY_PATH)
+    return store
+
+
+def print_leaderboard(store, period):
+    """Print the best scores of all time, this week or today."""
+    query = {"all": store.top, "week": store.top_of_week, "day": store.top_of_day}[period]
+    for (rank, entry) in enumerate(query(), 1):
+        print(f"{rank:2}. {entry['score']:8}  {entry['date']:%Y-%m-%d %H:%M}")
+
+
+def pack_formation(battle, rows, cols):
+    """Replace the battle's aliens with a rows by cols formation that fits the screen."""
+    battle.alien_setup(
+        rows,
+        cols,
+        x_distance=max(1, min(60, 420 // max(cols - 1, 1))),
+        y_distance=max(1, min(48, 300 // max(rows - 1, 1))),
+    )
+
+
+def main(args):
+    """Run the game the way the command line asked for."""
+    if args.leaderboard:
+        score_store = open_score_store(args.scores)
+        print_leaderboard(score_store, args.leaderboard)
+        score_store.close()
+        return 0
+    frame_profiler = profiler.FrameProfiler() if args.profile else None
+    replay_path = args.replay or args.view
+    # Headless runs and replays never finish a game that scores.
+    score_store = None
+    if not (args.headless or replay_path):
+        score_store = open_score_store(args.scores)
+    input_replay = replay.ReplayFile(replay_path) if replay_path else None
+    invaders = game.SpaceInvaders(
+        headless=args.headless,
+        frame_profiler=frame_profiler,
+        seed=input_replay.seed if input_replay else args.seed,
+        score_store=score_store,
+    )
+    invaders.sim_clock.scale(args.time_scale)
+    invaders.sim_clock.fast_forward = args.fast_forward
+    # The battle is built lazily behind the title; only build it up front
+    # when it has to be set up before play.
+    battle = None
+    if args.headless or input_replay or args.rows or args.cols or args.record:
+        battle = invaders.battle_scene
+        battle.replay = input_replay
+    if input_replay:
+        pack_formation(battle, *input_replay.formation)
+    elif args.rows or args.cols:
+        pack_formation(battle, args.rows or 6, args.cols or 8)
+    if args.record:
+        battle.recorder = replay.ReplayWriter(
+            args.record, battle.seed, args.keyframe_interval, battle.aliens.shape
+        )
+    if args.view:
+        invaders.view_replay(input_replay, args.seek)
+    frame_capture = None
+    if args.capture:
+        frame_capture = capture.FrameCapture(args.capture, args.capture_format)
+        invaders.add_frame_sink(frame_capture)
+    if args.shared_frames:
+        invaders.add_frame_sink(
+            framebuffer.SharedFrameBuffer.for_surface(invaders.screen, args.shared_frames)
+        )
+    try:
+        if args.headless:
+            result = invaders.run_headless(args.frames)
+            print(
+                f"Simulated {result['frames']} frames in {result['seconds']:.2f}s "
+                f"({result['frames'] / max(result['seconds'], 1e-9):.0f} frames/s), "
+                f"score {result['score']}."
+            )
+            return 0
+        return invaders.run()
+    finally:
+        if battle and battle.recorder:
+            battle.recorder.close()
+        invaders.close_frame_sinks()
+        if score_store is not None:
+            score_store.close()
+        if frame_capture:
+            print(
+                f"Captured {frame_capture.written} of {frame_capture.frames} frames "
+                f"({frame_capture.dropped} dropped)."
+            )
+            if frame_capture.error:
+                print(f"Frame capture stopped: {frame_capture.error}")
+        if frame_profiler:
+            print(frame_profiler.summary())
+            print(
+                "Asset cache: {hits} hits, {misses} misses, {evictions} evictions, "
+                "{entries} entries, {bytes} bytes".format(
+                    **(invaders.asset_stats or assets.cache.stats())
+                )
+            )
+
 
 if __name__ == "__main__":
-    # TODO: Prepare and run the game
-    sys.exit(game.SpaceInvaders().run())
+    sys.exit(main(parse_args()))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""
+Plays headless Space Invaders matches between bot policies on every core.
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import time
+import traceback
+
+import bots
+
+
+def parse_args():
+    """Parse the command line options."""
+    parser = argparse.ArgumentParser(description="Run a Space Invaders bot tournament.")
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(bots.POLICIES),
+        help="policy to enter; repeat to enter several (default: all)",
+    )
+    parser.add_argument(
+        "--matches", type=int, default=8, help="matches played by each policy"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first match"
+    )
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=36000,
+        help="stop a match after this many frames (default: 10 minutes of play)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="worker processes (default: one per core)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="seconds without any finished match before the rest count as crashed",
+    )
+    return parser.parse_args()
+
+
+def start_worker():
+    """Put a worker process on SDL's dummy drivers before pygame is imported."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+def play_match(match):
+    """Play one match in a worker and return its result dict.
+
+    Errors are returned as part of the result so one broken match does not
+    take the tournament down with it.
+    """
+    result = dict(match)
+    try:
+        import game  # pylint: disable=import-outside-toplevel
+        invaders = game.SpaceInvaders(headless=True, seed=match['seed'])
+        invaders.battle_scene.controller = bots.make(match['policy'], match['seed'])
+        result.update(invaders.run_headless(match['max_frames']))
+    except Exception:  # pylint: disable=broad-except
+        result['error'] = traceback.format_exc()
+    return result
+
+
+def run_tournament(matches, workers, timeout):
+    """Play matches on a pool of workers and yield each result as it finishes.
+
+    A worker that dies takes its match with it; the pool replaces the
+    worker, and once no match has finished for timeout seconds the
+    matches still missing are yielded with a 'crashed' error.
+    """
+    results = queue.Queue()
+    with multiprocessing.Pool(workers, initializer=start_worker) as pool:
+        pending = {}
+        for match in matches:
+            pending[match['match']] = match
+            pool.apply_async(
+                play_match,
+                (match,),
+                callback=results.put,
+                error_callback=lambda error, match=match: results.put(
+                    dict(match, error=repr(error))
+                ),
+            )
+        while pending:
+            try:
+                result = results.get(timeout=timeout)
+            except queue.Empty:
+                for match in pending.values():
+                    yield dict(match, error='crashed')
+                pool.terminate()
+                return
+            del pending[result['match']]
+            yield result
+
+
+def print_result(result):
+    """Print one finished match."""
+    if 'error' in result:
+        error = result['error'].strip().splitlines()[-1]
+        print(f"match {result['match']:>4} {result['policy']:<8} seed {result['seed']}: {error}")
+        return
+    print(
+        f"match {result['match']:>4} {result['policy']:<8} seed {result['seed']}: "
+        f"score {result['score']}, {result['frames']} frames, "
+        f"{result['lives_lost']} lives lost{', won' if result['won'] else ''}"
+    )
+
+
+def print_summary(results):
+    """Print per-policy averages over every finished match."""
+    print(f"\n{'policy':<10}{'played':>8}{'failed':>8}{'mean score':>12}"
+          f"{'best':>8}{'mean frames':>13}{'lives lost':>12}{'won':>6}")
+    for policy in sorted({result['policy'] for result in results}):
+        played = [r for r in results if r['policy'] == policy and 'error' not in r]
+        failed = sum(1 for r in results if r['policy'] == policy and 'error' in r)
+        count = max(len(played), 1)
+        print(
+            f"{policy:<10}{len(played):>8}{failed:>8}"
+            f"{sum(r['score'] for r in played) / count:>12.1f}"
+            f"{max((r['score'] for r in played), default=0):>8}"
+            f"{sum(r['frames'] for r in played) / count:>13.1f}"
+            f"{sum(r['lives_lost'] for r in played) / count:>12.2f}"
+            f"{sum(r['won'] for r in played):>6}"
+        )
+
+
+def main(args):
+    """Run the tournament the command line asked for."""
+    policies = args.policy or sorted(bots.POLICIES)
+    matches = [
+        {
+            'match': index,
+            'policy': policy,
+            'seed': args.seed + round_index,
+            'max_frames': args.max_frames,
+        }
+        for (index, (round_index, policy)) in enumerate(
+            (round_index, policy)
+            for round_index in range(args.matches)
+            for policy in policies
+        )
+    ]
+    start = time.perf_counter()
+    results = []
+    for result in run_tournament(matches, args.workers, args.timeout):
+        print_result(result)
+        results.append(result)
+    print_summary(results)
+    print(f"\n{len(results)} matches in {time.perf_counter() - start:.1f}s "
+          f"on {args.workers} workers.")
+    return 0 if all('error' not in result for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -1,18 +1,144 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Load images, sounds and fonts by key and share them through one cache."""
 
 import os
+from collections import OrderedDict
 import pygame
 
 main_dir = os.path.split(os.path.abspath(__file__))[0]
 data_dir = os.path.join(main_dir, "data")
 
 asset_dict = {
-  'soundtrack': '8bp051-06-random-happy_ending_after_all.mp3',
+    'soundtrack': 'Visager_-_15_-_Epilogue.mp3',
+    #https://unsplash.com/images/nature/space : website used to grab this background - 6-27-2023
+    'background': 'photo-1534796636912-3b95b3ab5986.jpeg',
+    'player': 'player.png',
+    'red': 'red.png',
+    'green': 'green.png',
+    'yellow': 'yellow.png',
+    'extra': 'extra.png',
+    'laser': 'laser.wav',
+    'explosion': 'explosion.wav',
+    #https://www.1001fonts.com/ : is where the font was aquired - 6-27-2023
+    'arcade': 'ARCADECLASSIC.TTF',
+    'pixeled': 'Pixeled.ttf',
 }
 
 def get(key):
-  value = asset_dict.get(key, None)
-  assert value
-  if value:
-    value = os.path.join(data_dir, value)
-  return value
+    """Return the path of the asset stored under key."""
+    value = asset_dict.get(key, None)
+    assert value
+    if value:
+        value = os.path.join(data_dir, value)
+    return value
+
+
+class AssetCache:
+    """Least recently used cache of decoded assets."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, cache_key, load, size_of):
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(cache_key)
+            return entry[0]
+        self.misses += 1
+        value = load()
+        size = size_of(value)
+        self._entries[cache_key] = (value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            (_, (_, evicted_size)) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+        return value
+
+    def image(self, key, alpha=True):
+        """Return the image under key converted for fast blitting to the display."""
+        def load():
+            surface = pygame.image.load(get(key))
+            return surface.convert_alpha() if alpha else surface.convert()
+        return self._lookup(('image', key, alpha), load, _surface_bytes)
+
+    def sound(self, key):
+        """Return the sound under key; the Sound object is shared by every caller."""
+        return self._lookup(('sound', key), lambda: pygame.mixer.Sound(get(key)), _sound_bytes)
+
+    def font(self, key, size):
+        """Return the font under key at the given point size."""
+        return self._lookup(
+            ('font', key, size),
+            lambda: pygame.font.Font(get(key), size),
+            lambda font: os.path.getsize(get(key)),
+        )
+
+    def text(self, key, size, message, color, antialias=True, fonts=None):
+        """Return message rendered with the font under key, rasterized only once."""
+        color = tuple(color) if not isinstance(color, str) else color
+        return self._lookup(
+            ('text', key, size, message, color, antialias),
+            lambda: (fonts or self).font(key, size).render(message, antialias, color),
+            _surface_bytes,
+        )
+
+    def clear(self):
+        """Drop every cached asset."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        """Return the hit, miss and eviction counts and the memory in use."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+def _sound_bytes(sound):
+    (frequency, size, channels) = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+cache = AssetCache()
+text_cache = AssetCache(max_bytes=4 * 1024 * 1024)
+
+def image(key, alpha=True):
+    """Return the shared image under key."""
+    return cache.image(key, alpha)
+
+def sound(key):
+    """Return the shared sound under key."""
+    return cache.sound(key)
+
+def font(key, size):
+    """Return the shared font under key at the given size."""
+    return cache.font(key, size)
+
+def text(key, size, message, color, antialias=True):
+    """Return the shared rendering of message in the font under key."""
+    return text_cache.text(key, size, message, color, antialias, cache)
 
+def clear():
+    """Drop every shared asset; call it before pygame.quit()."""
+    cache.clear()
+    text_cache.clear()
@@ -0,0 +1,281 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Many independent battles stepped together in batched NumPy arrays."""
+
+import numpy as np
+import formation
+import obstacle
+import replay
+
+# Sizes of the sprite images and the BattleScene layout the batch mirrors.
+PLAYER_SIZE = (60, 30)
+PLAYER_SPEED = 5
+ALIEN_SIZE = (40, 32)
+TOP_ALIEN_SIZE = (40, 20)
+TOP_ALIEN_Y = 80
+TOP_ALIEN_POINTS = 500
+LASER_SIZE = (4, 20)
+LASER_MARGIN = 50
+PLAYER_LASER_SPEED = -8
+ALIEN_LASER_SPEED = 6
+LASER_COOLDOWN = 24
+ALIEN_FIRE_STEPS = 48
+SHIELD_SIZE = 6
+SHIELD_COUNT = 4
+SHIELD_Y = 480
+LIVES = 3
+
+
+def _overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Broadcast a rect overlap test between two sets of rects."""
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+
+class BatchBattle:
+    """N battles played by the BattleScene rules, advanced by one step() call."""
+
+    def __init__(self, num_games, seed=None, rows=6, cols=8, width=600, height=600,
+                 player_lasers=4, alien_lasers=8):
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        (kind, self.alien_dx, self.alien_dy) = formation.layout(rows, cols)
+        self.alien_value = formation.VALUES[kind]
+        num_aliens = rows * cols
+        blocks = [
+            (count * (width / SHIELD_COUNT) + width / 15 + col * SHIELD_SIZE,
+             SHIELD_Y + row * SHIELD_SIZE)
+            for count in range(SHIELD_COUNT)
+            for (row, line) in enumerate(obstacle.shape)
+            for (col, cell) in enumerate(line)
+            if cell == 'x'
+        ]
+        (self.block_x, self.block_y) = np.array(blocks, dtype=np.int32).T
+
+        n = num_games
+        self.player_x = np.zeros(n, dtype=np.int32)
+        self.player_y = height - PLAYER_SIZE[1]
+        self.ready = np.zeros(n, dtype=bool)
+        self.laser_time = np.zeros(n, dtype=np.int32)
+        self.origin_x = np.zeros(n, dtype=np.int32)
+        self.origin_y = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int32)
+        self.alive = np.zeros((n, num_aliens), dtype=bool)
+        self.blocks = np.zeros((n, len(self.block_x)), dtype=bool)
+        self.shot_x = np.zeros((n, player_lasers), dtype=np.int32)
+        self.shot_y = np.zeros((n, player_lasers), dtype=np.int32)
+        self.shot_alive = np.zeros((n, player_lasers), dtype=bool)
+        self.bomb_x = np.zeros((n, alien_lasers), dtype=np.int32)
+        self.bomb_y = np.zeros((n, alien_lasers), dtype=np.int32)
+        self.bomb_alive = np.zeros((n, alien_lasers), dtype=bool)
+        self.top_x = np.zeros(n, dtype=np.int32)
+        self.top_speed = np.zeros(n, dtype=np.int32)
+        self.top_active = np.zeros(n, dtype=bool)
+        self.top_time = np.zeros(n, dtype=np.int32)
+        self.fire_time = np.zeros(n, dtype=np.int32)
+        self.lives = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.final_score = np.zeros(n, dtype=np.int64)
+        self._obs = np.zeros(
+            (n, 7 + num_aliens + 3 * (player_lasers + alien_lasers)), dtype=np.float32
+        )
+        self.reset()
+
+    @property
+    def observation_size(self):
+        """Number of floats in one game's observation."""
+        return self._obs.shape[1]
+
+    def reset(self, games=None):
+        """Start the games selected by the boolean mask games, or all of them."""
+        if games is None:
+            games = np.ones(self.num_games, dtype=bool)
+        count = int(np.count_nonzero(games))
+        self.player_x[games] = self.width // 2 - PLAYER_SIZE[0] // 2
+        self.ready[games] = True
+        self.laser_time[games] = 0
+        self.origin_x[games] = 70
+        self.origin_y[games] = 100
+        self.direction[games] = 1
+        self.alive[games] = True
+        self.blocks[games] = True
+        self.shot_alive[games] = False
+        self.bomb_alive[games] = False
+        self.top_active[games] = False
+        self.top_time[games] = self.rng.integers(40, 81, count)
+        self.fire_time[games] = 0
+        self.lives[games] = LIVES
+        self.score[games] = 0
+        self.frames[games] = 0
+        return self.observe()
+
+    def observe(self):
+        """Write every game's observation into the shared buffer and return it."""
+        obs = self._obs
+        obs[:, 0] = self.player_x
+        obs[:, 1] = self.origin_x
+        obs[:, 2] = self.origin_y
+        obs[:, 3] = self.direction
+        obs[:, 4] = self.lives
+        obs[:, 5] = self.top_x
+        obs[:, 6] = self.top_active
+        start = 7 + self.alive.shape[1]
+        obs[:, 7:start] = self.alive
+        for (x, y, alive) in ((self.shot_x, self.shot_y, self.shot_alive),
+                              (self.bomb_x, self.bomb_y, self.bomb_alive)):
+            slots = x.shape[1]
+            obs[:, start:start + 3 * slots:3] = x
+            obs[:, start + 1:start + 3 * slots:3] = y
+            obs[:, start + 2:start + 3 * slots:3] = alive
+            start += 3 * slots
+        return obs
+
+    @staticmethod
+    def _spawn(games, x, y, slot_x, slot_y, slot_alive):
+        """Put a laser at (x, y) in the first free slot of each selected game."""
+        games = games & ~slot_alive.all(axis=1)
+        rows = np.flatnonzero(games)
+        slots = np.argmin(slot_alive[rows], axis=1)
+        slot_x[rows, slots] = x[rows]
+        slot_y[rows, slots] = y[rows]
+        slot_alive[rows, slots] = True
+
+    def _alien_x(self):
+        return self.origin_x[:, None] + self.alien_dx
+
+    def _alien_y(self):
+        return self.origin_y[:, None] + self.alien_dy
+
+    def _hit_blocks(self, x, y, alive):
+        """Erode the blocks under the lasers (x, y) and kill the lasers that hit."""
+        hits = (
+            _overlap(x[:, :, None], y[:, :, None], LASER_SIZE[0], LASER_SIZE[1],
+                     self.block_x, self.block_y, SHIELD_SIZE, SHIELD_SIZE)
+            & alive[:, :, None] & self.blocks[:, None, :]
+        )
+        self.blocks &= ~hits.any(axis=1)
+        alive &= ~hits.any(axis=2)
+
+    def step(self, actions):
+        """Advance every game by one step; return (observations, rewards, dones)."""
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+        half_laser = np.array(LASER_SIZE) // 2
+
+        # Player input, borders and shot cooldown, as in Player.update.
+        right = (actions & replay.MOVE_RIGHT) != 0
+        left = ((actions & replay.MOVE_LEFT) != 0) & ~right
+        self.player_x += PLAYER_SPEED * (right.astype(np.int32) - left)
+        fire = (actions & replay.FIRE) != 0
+        self._spawn(
+            fire & self.ready,
+            self.player_x + PLAYER_SIZE[0] // 2 - half_laser[0],
+            np.full(self.num_games, self.player_y + PLAYER_SIZE[1] // 2 - half_laser[1]),
+            self.shot_x, self.shot_y, self.shot_alive,
+        )
+        np.clip(self.player_x, 0, self.width - PLAYER_SIZE[0], out=self.player_x)
+        self.ready &= ~fire
+        self.laser_time[fire] = 0
+        cooling = ~self.ready
+        self.laser_time[cooling] += 1
+        self.ready |= cooling & (self.laser_time >= LASER_COOLDOWN)
+
+        # A random alive alien fires on every alien laser timer tick.
+        self.fire_time += 1
+        firing = (self.fire_time >= ALIEN_FIRE_STEPS) & self.alive.any(axis=1)
+        self.fire_time[self.fire_time >= ALIEN_FIRE_STEPS] = 0
+        shooter = np.argmax(self.rng.random(self.alive.shape) * self.alive, axis=1)
+        self._spawn(
+            firing,
+            self.origin_x + self.alien_dx[shooter] + ALIEN_SIZE[0] // 2 - half_laser[0],
+            self.origin_y + self.alien_dy[shooter] + ALIEN_SIZE[1] // 2 - half_laser[1],
+            self.bomb_x, self.bomb_y, self.bomb_alive,
+        )
+
+        # Movement of the top alien, the formation and every laser.
+        self.top_x += self.top_speed * self.top_active
+        self.origin_x += self.direction
+        self.shot_y += PLAYER_LASER_SPEED
+        self.bomb_y += ALIEN_LASER_SPEED
+        for (y, alive) in ((self.shot_y, self.shot_alive), (self.bomb_y, self.bomb_alive)):
+            alive &= (y > -LASER_MARGIN) & (y < self.height + LASER_MARGIN)
+
+        # Collisions, in the order BattleScene.collisions checks them.
+        self._hit_blocks(self.shot_x, self.shot_y, self.shot_alive)
+        alien_x = self._alien_x()
+        alien_y = self._alien_y()
+        hits = (
+            _overlap(self.shot_x[:, :, None], self.shot_y[:, :, None], *LASER_SIZE,
+                     alien_x[:, None, :], alien_y[:, None, :], *ALIEN_SIZE)
+            & self.shot_alive[:, :, None] & self.alive[:, None, :]
+        )
+        killed = hits.any(axis=1)
+        self.score += (killed * self.alien_value).sum(axis=1)
+        self.alive &= ~killed
+        self.shot_alive &= ~hits.any(axis=2)
+        top_hits = (
+            _overlap(self.shot_x, self.shot_y, *LASER_SIZE,
+                     self.top_x[:, None], TOP_ALIEN_Y, *TOP_ALIEN_SIZE)
+            & self.shot_alive & self.top_active[:, None]
+        )
+        top_hit = top_hits.any(axis=1)
+        self.score += TOP_ALIEN_POINTS * top_hit
+        self.top_active &= ~top_hit
+        self.shot_alive &= ~top_hits
+
+        self._hit_blocks(self.bomb_x, self.bomb_y, self.bomb_alive)
+        player_hits = (
+            _overlap(self.bomb_x, self.bomb_y, *LASER_SIZE,
+                     self.player_x[:, None], self.player_y, *PLAYER_SIZE)
+            & self.bomb_alive
+        )
+        self.lives -= player_hits.sum(axis=1)
+        self.bomb_alive &= ~player_hits
+
+        low = np.flatnonzero(
+            (np.where(self.alive, alien_y + ALIEN_SIZE[1], 0).max(axis=1) > SHIELD_Y)
+        )
+        if low.size:
+            eroded = (
+                _overlap(alien_x[low, :, None], alien_y[low, :, None], *ALIEN_SIZE,
+                         self.block_x, self.block_y, SHIELD_SIZE, SHIELD_SIZE)
+                & self.alive[low, :, None]
+            ).any(axis=1)
+            self.blocks[low] &= ~eroded
+        invaded = (
+            _overlap(alien_x, alien_y, *ALIEN_SIZE,
+                     self.player_x[:, None], self.player_y, *PLAYER_SIZE)
+            & self.alive
+        ).any(axis=1)
+
+        # The formation turns and drops at the sides, as in alien_pos.
+        any_alive = self.alive.any(axis=1)
+        right_edge = np.where(self.alive, alien_x + ALIEN_SIZE[0], 0).max(axis=1)
+        left_edge = np.where(self.alive, alien_x, self.width).min(axis=1)
+        turn_left = any_alive & (right_edge >= self.width)
+        turn_right = any_alive & ~turn_left & (left_edge <= 0)
+        self.direction[turn_left] = -1
+        self.direction[turn_right] = 1
+        self.origin_y += 2 * (turn_left | turn_right)
+
+        # The top alien appears when its timer runs out, as in top_dog_alien.
+        self.top_time -= 1
+        due = self.top_time <= 0
+        spawn = due & ~self.top_active
+        from_right = self.rng.random(self.num_games) < 0.5
+        self.top_x[spawn] = np.where(from_right, self.width + 50, -50)[spawn]
+        self.top_speed[spawn] = np.where(from_right, -3, 3)[spawn]
+        self.top_active |= spawn
+        self.top_time[due] = self.rng.integers(40, 81, int(np.count_nonzero(due)))
+
+        self.frames += 1
+        rewards = self.score - score_before
+        dones = (self.lives <= 0) | invaded | ~any_alive
+        self.final_score[dones] = self.score[dones]
+        if dones.any():
+            self.reset(dones)
+        return (self.observe(), rewards, dones)
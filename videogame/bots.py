@@ -0,0 +1,55 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Bot policies that play a BattleScene through its controller hook."""
+
+import random
+import replay
+
+
+def idle(seed):
+    """Return a policy that never moves or shoots."""
+    def policy(scene):
+        return 0
+    return policy
+
+
+def random_walk(seed):
+    """Return a policy that mashes random buttons, seeded for reproducible matches."""
+    rng = random.Random(seed)
+    choices = (0, replay.MOVE_LEFT, replay.MOVE_RIGHT, replay.FIRE,
+               replay.MOVE_LEFT | replay.FIRE, replay.MOVE_RIGHT | replay.FIRE)
+    def policy(scene):
+        return rng.choice(choices)
+    return policy
+
+
+def tracker(seed):
+    """Return a policy that chases the lowest alien and shoots whenever it can."""
+    def policy(scene):
+        player = scene.player.sprite
+        alive = scene.aliens.alive_indices()
+        if not alive.size:
+            return 0
+        lowest = alive[scene.aliens.y[alive].argmax()]
+        target = scene.aliens.rect(lowest).centerx
+        controls = replay.FIRE if player.ready else 0
+        if target > player.rect.centerx + player.speed:
+            controls |= replay.MOVE_RIGHT
+        elif target < player.rect.centerx - player.speed:
+            controls |= replay.MOVE_LEFT
+        return controls
+    return policy
+
+
+POLICIES = {
+    'idle': idle,
+    'random': random_walk,
+    'tracker': tracker,
+}
+
+
+def make(name, seed):
+    """Build the policy registered under name for a match played with seed."""
+    return POLICIES[name](seed)
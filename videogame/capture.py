@@ -0,0 +1,111 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Write rendered frames to disk on a background thread."""
+
+import os
+import queue
+import struct
+import threading
+import zlib
+import pygame
+
+MAGIC = b'SIFC'
+VERSION = 1
+FORMATS = ('raw', 'zlib', 'png')
+HEADER = struct.Struct('<4sHHHB')
+FRAME = struct.Struct('<QI')
+
+
+class FrameCapture:
+    """A frame sink that streams every published frame to disk."""
+
+    def __init__(self, path, file_format='zlib', queue_size=120):
+        if file_format not in FORMATS:
+            raise ValueError(f'file_format must be one of {FORMATS}')
+        self._path = path
+        self._format = file_format
+        self._queue = queue.Queue(queue_size)
+        self._file = None
+        self._size = None
+        self.frames = 0
+        self.written = 0
+        self.dropped = 0
+        self.error = None
+        if file_format == 'png':
+            os.makedirs(path, exist_ok=True)
+        else:
+            self._file = open(path, 'wb')
+        self._thread = threading.Thread(
+            target=self._write_frames, name='frame-capture', daemon=True
+        )
+        self._thread.start()
+
+    def publish(self, surface):
+        """Queue a copy of surface's pixels, or drop it if the writer is behind."""
+        self.frames += 1
+        if self.error is not None or not self._thread.is_alive():
+            self.dropped += 1
+            return
+        if self._size is None:
+            self._size = surface.get_size()
+        try:
+            self._queue.put_nowait((self.frames, pygame.image.tobytes(surface, 'RGBX')))
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_frames(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                self._write_frame(*item)
+                self.written += 1
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.error = error
+        finally:
+            if self._file:
+                self._file.close()
+
+    def _write_frame(self, number, pixels):
+        if self._format == 'png':
+            image = pygame.image.frombytes(pixels, self._size, 'RGBX')
+            pygame.image.save(image, os.path.join(self._path, f'frame_{number:06d}.png'))
+            return
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(
+                MAGIC, VERSION, *self._size, FORMATS.index(self._format)
+            ))
+        if self._format == 'zlib':
+            pixels = zlib.compress(pixels, 1)
+        self._file.write(FRAME.pack(number, len(pixels)))
+        self._file.write(pixels)
+
+    def close(self):
+        """Write every queued frame, then stop the writer thread."""
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+
+
+def read_frames(path):
+    """Yield (frame number, Surface) for every frame in a raw or zlib capture."""
+    with open(path, 'rb') as capture:
+        (magic, version, width, height, file_format) = HEADER.unpack(capture.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} frame capture')
+        while True:
+            record = capture.read(FRAME.size)
+            if len(record) < FRAME.size:
+                return
+            (number, length) = FRAME.unpack(record)
+            pixels = capture.read(length)
+            if FORMATS[file_format] == 'zlib':
+                pixels = zlib.decompress(pixels)
+            yield (number, pygame.image.frombytes(pixels, (width, height), 'RGBX'))
@@ -0,0 +1,118 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Reinforcement learning environment with reset() and step() around BattleScene."""
+
+import numpy as np
+import pygame
+import assets
+import game
+import replay
+import scene
+from features import StateEncoder
+
+ACTIONS = (
+    0,
+    replay.MOVE_LEFT,
+    replay.MOVE_RIGHT,
+    replay.FIRE,
+    replay.MOVE_LEFT | replay.FIRE,
+    replay.MOVE_RIGHT | replay.FIRE,
+)
+
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class InvadersEnv:
+    """A headless battle that an agent plays one action at a time."""
+
+    def __init__(
+        self, seed=None, grayscale=False, downsample=1, frame_stack=1, frame_skip=1,
+        features=False
+    ):
+        self._game = game.VideoGame(headless=True)
+        (width, height) = self._game.window_size
+        self._frame = np.zeros((height, width, 4), dtype=np.uint8)
+        self._canvas = pygame.image.frombuffer(self._frame, (width, height), 'RGBX')
+        self._pixels = self._frame[::downsample, ::downsample, :3]
+        self._grayscale = grayscale
+        self._frame_stack = frame_stack
+        self._frame_skip = frame_skip
+        self._seed = seed
+        self._episode = 0
+        shape = self._pixels.shape[:2] if grayscale else self._pixels.shape
+        self._gray = np.zeros(shape, dtype=np.float32) if grayscale else None
+        self._ring = np.zeros((frame_stack,) + shape, dtype=np.float32 if grayscale else np.uint8)
+        self._stacked = np.zeros_like(self._ring)
+        self._ring_index = 0
+        self._controls = 0
+        self._encoder = StateEncoder() if features else None
+        self.scene = None
+
+    @property
+    def action_count(self):
+        """Number of discrete actions step() accepts."""
+        return len(ACTIONS)
+
+    @property
+    def observation_shape(self):
+        """Shape of the observations returned by reset() and step()."""
+        if self._encoder:
+            return self._encoder.buffer.shape
+        if self._frame_stack > 1:
+            return self._ring.shape
+        return self._ring.shape[1:]
+
+    def _control(self, battle):
+        return self._controls
+
+    def reset(self, seed=None):
+        """Start a new battle and return its first observation."""
+        if seed is None and self._seed is not None:
+            seed = self._seed + self._episode
+        self._episode += 1
+        if self.scene is None:
+            self.scene = scene.BattleScene(
+                self._canvas, assets.image('background', alpha=False), seed
+            )
+            self.scene.controller = self._control
+        else:
+            self.scene.reset(seed)
+        self.scene.invalidate()
+        self._ring[:] = 0
+        return self._render()
+
+    def step(self, action):
+        """Play one action; return (observation, reward, done, info)."""
+        self._controls = ACTIONS[action]
+        score = self.scene.score
+        for _ in range(self._frame_skip):
+            for event in pygame.event.get():
+                self.scene.process_event(event)
+            self.scene.update_scene()
+            if not self.scene.is_valid():
+                break
+        observation = self._render()
+        done = not self.scene.is_valid()
+        return (observation, self.scene.score - score, done, self.scene.result())
+
+    def _render(self):
+        if self._encoder:
+            return self._encoder.encode(self.scene)
+        self.scene.draw()
+        self.scene.render_updates()
+        frame = self._pixels
+        if self._grayscale:
+            frame = np.matmul(self._pixels, GRAY_WEIGHTS, out=self._gray)
+        if self._frame_stack == 1:
+            return frame
+        self._ring[self._ring_index] = frame
+        self._ring_index = (self._ring_index + 1) % self._frame_stack
+        order = np.arange(self._ring_index, self._ring_index + self._frame_stack) % self._frame_stack
+        return np.take(self._ring, order, axis=0, out=self._stacked)
+
+    def close(self):
+        """Shut pygame down."""
+        assets.clear()
+        pygame.quit()
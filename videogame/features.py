@@ -0,0 +1,71 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Compact feature vector describing a BattleScene, written into one reused buffer."""
+
+import numpy as np
+
+
+class StateEncoder:
+    """Write the state of a battle into a float32 vector allocated once."""
+
+    def __init__(self, num_aliens=48, num_shields=4, max_lasers=32):
+        sizes = (
+            ('player_x', 1),
+            ('lives', 1),
+            ('score', 1),
+            ('top_alien', 3),
+            ('alien_x', num_aliens),
+            ('alien_y', num_aliens),
+            ('alien_alive', num_aliens),
+            ('shields', num_shields),
+            ('laser_x', max_lasers),
+            ('laser_y', max_lasers),
+            ('laser_owner', max_lasers),
+            ('laser_alive', max_lasers),
+        )
+        self.slices = {}
+        start = 0
+        for (name, size) in sizes:
+            self.slices[name] = slice(start, start + size)
+            start += size
+        self.buffer = np.zeros(start, dtype=np.float32)
+        self._views = {name: self.buffer[part] for (name, part) in self.slices.items()}
+        self.max_lasers = max_lasers
+
+    @classmethod
+    def for_scene(cls, battle, max_lasers=32):
+        """Return an encoder sized for battle's formation and shields."""
+        return cls(len(battle.aliens.alive), len(battle.shields), max_lasers)
+
+    def encode(self, battle):
+        """Write battle's current state into buffer and return buffer."""
+        views = self._views
+        player = battle.player.sprite
+        views['player_x'][0] = player.rect.x
+        views['lives'][0] = battle.lives
+        views['score'][0] = battle.score
+        top = views['top_alien']
+        top[2] = 0
+        for top_alien in battle.top:
+            (top[0], top[1]) = top_alien.rect.topleft
+            top[2] = 1
+
+        aliens = battle.aliens
+        np.add(aliens.origin[0], aliens.dx, out=views['alien_x'], casting='unsafe')
+        np.add(aliens.origin[1], aliens.dy, out=views['alien_y'], casting='unsafe')
+        views['alien_alive'][:] = aliens.alive
+
+        shields = views['shields']
+        for (index, bunker) in enumerate(battle.shields):
+            shields[index] = bunker.coverage()
+
+        lasers = battle.lasers
+        count = min(len(lasers.alive), self.max_lasers)
+        views['laser_x'][:count] = lasers.x[:count]
+        views['laser_y'][:count] = lasers.y[:count]
+        views['laser_owner'][:count] = lasers.owner[:count]
+        views['laser_alive'][:count] = lasers.alive[:count]
+        views['laser_alive'][count:] = 0
+        return self.buffer
@@ -0,0 +1,148 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Alien formation stored as NumPy arrays instead of one sprite per alien."""
+
+import numpy as np
+import pygame
+import assets
+
+KINDS = ('yellow', 'green', 'red')
+VALUES = np.array([300, 200, 100], dtype=np.int32)
+
+
+def row_kind(row_index):
+    """Return the index into KINDS of the aliens on a formation row."""
+    if row_index == 0:
+        return 0
+    if 1 <= row_index <= 2:
+        return 1
+    return 2
+
+
+def _cell_range(start, end, reach, spacing, count):
+    """Return the grid cells [first, last) whose aliens can overlap [start, end)."""
+    first = max(-((reach - 1 - start) // spacing), 0)
+    return (first, min((end - 1) // spacing + 1, count))
+
+
+def layout(rows, cols, x_distance=60, y_distance=48):
+    """Return the kind, x offset and y offset of every alien in a formation."""
+    (row_index, col_index) = np.divmod(np.arange(rows * cols), cols)
+    kind = np.array([row_kind(row) for row in range(rows)], dtype=np.int8)[row_index]
+    return (
+        kind,
+        (col_index * x_distance).astype(np.int32),
+        (row_index * y_distance).astype(np.int32),
+    )
+
+
+class AlienFormation:
+    """The alien grid as a struct of arrays around a shared origin."""
+
+    def __init__(self, rows, cols, x_distance=60, y_distance=48, x_offset=70, y_offset=100):
+        (self.kind, self.dx, self.dy) = layout(rows, cols, x_distance, y_distance)
+        self.value = VALUES[self.kind]
+        self.shape = (rows, cols)
+        self.spacing = (max(x_distance, 1), max(y_distance, 1))
+        self.alive = np.ones(rows * cols, dtype=bool)
+        self.images = [assets.image(kind) for kind in KINDS]
+        sizes = np.array([image.get_size() for image in self.images], dtype=np.int32)
+        self.w = sizes[self.kind, 0]
+        self.h = sizes[self.kind, 1]
+        self._reach = (int(self.w.max()), int(self.h.max()))
+        self._grid = np.arange(rows * cols).reshape(rows, cols)
+        self.start = (x_offset, y_offset)
+        self.origin = np.array(self.start, dtype=np.int32)
+        self.previous_origin = self.origin.copy()
+        self.direction = 1
+
+    def reset(self):
+        """Bring every alien back to life at the starting position."""
+        self.alive[:] = True
+        self.origin[:] = self.start
+        self.previous_origin[:] = self.start
+        self.direction = 1
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    @property
+    def x(self):
+        """Left edge of every alien on screen."""
+        return self.origin[0] + self.dx
+
+    @property
+    def y(self):
+        """Top edge of every alien on screen."""
+        return self.origin[1] + self.dy
+
+    def save_position(self):
+        """Remember the origin before this step for interpolated drawing."""
+        self.previous_origin[:] = self.origin
+
+    def update(self):
+        """Move the formation sideways by one step."""
+        self.origin[0] += self.direction
+
+    def check_edges(self, width, distance=2):
+        """Turn around and drop once when any alive alien touches a side."""
+        if not self.alive.any():
+            return
+        left = self.x[self.alive].min()
+        right = (self.x + self.w)[self.alive].max()
+        if right >= width:
+            self.direction = -1
+            self.origin[1] += distance
+        elif left <= 0:
+            self.direction = 1
+            self.origin[1] += distance
+
+    def overlapping(self, rect):
+        """Return the indices of alive aliens whose rects overlap rect, in order."""
+        (left, top) = self.origin.tolist()
+        (rows, cols) = self.shape
+        (first_col, last_col) = _cell_range(
+            rect.left - left, rect.right - left, self._reach[0], self.spacing[0], cols
+        )
+        (first_row, last_row) = _cell_range(
+            rect.top - top, rect.bottom - top, self._reach[1], self.spacing[1], rows
+        )
+        if first_col >= last_col or first_row >= last_row:
+            return np.empty(0, dtype=np.intp)
+        cells = self._grid[first_row:last_row, first_col:last_col].ravel()
+        x = left + self.dx[cells]
+        y = top + self.dy[cells]
+        return cells[
+            self.alive[cells]
+            & (x < rect.right) & (x + self.w[cells] > rect.left)
+            & (y < rect.bottom) & (y + self.h[cells] > rect.top)
+        ]
+
+    def kill(self, indices):
+        """Remove the aliens at indices and return the points they were worth."""
+        self.alive[indices] = False
+        return int(self.value[indices].sum())
+
+    def rect(self, index):
+        """Return the screen rect of one alien."""
+        return pygame.Rect(
+            int(self.x[index]), int(self.y[index]), int(self.w[index]), int(self.h[index])
+        )
+
+    def alive_indices(self):
+        """Return the indices of every alien still alive."""
+        return np.flatnonzero(self.alive)
+
+    def blit_sequence(self, alpha=1.0):
+        """Return (image, position) pairs for every alive alien."""
+        (ox, oy) = self.previous_origin + (self.origin - self.previous_origin) * alpha
+        indices = self.alive_indices()
+        images = self.images
+        return [
+            (images[kind], (ox + dx, oy + dy))
+            for (kind, dx, dy) in zip(
+                self.kind[indices].tolist(), self.dx[indices].tolist(), self.dy[indices].tolist()
+            )
+        ]
@@ -0,0 +1,131 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Share rendered frames with other local processes through shared memory."""
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+import pygame
+
+MAGIC = b'SISM'
+# Version 1 frames held the display's own pixel layout.
+VERSION = 2
+HEADER = struct.Struct('<4sHHHHI')
+# The header is followed by the latest sequence number and one sequence
+# number per slot, all uint64, then the slots themselves.
+SEQUENCE_OFFSET = 16
+DEFAULT_NAME = 'space-invaders-frames'
+
+
+def _views(buffer, slots, height, pitch):
+    """Return the sequence numbers and the (slots, height, pitch) byte array in buffer."""
+    sequences = np.ndarray((slots + 1,), dtype=np.uint64, buffer=buffer, offset=SEQUENCE_OFFSET)
+    frames = np.ndarray(
+        (slots, height, pitch), dtype=np.uint8, buffer=buffer,
+        offset=SEQUENCE_OFFSET + sequences.nbytes,
+    )
+    return (sequences, frames)
+
+
+class SharedFrameBuffer:
+    """A frame sink that publishes every frame into a shared memory ring."""
+
+    def __init__(self, size, name=DEFAULT_NAME, slots=4):
+        (width, height) = size
+        self.pitch = width * 4
+        self.slots = slots
+        self.size = size
+        frame_bytes = height * self.pitch
+        self._memory = shared_memory.SharedMemory(
+            name, create=True, size=SEQUENCE_OFFSET + 8 * (slots + 1) + slots * frame_bytes
+        )
+        HEADER.pack_into(self._memory.buf, 0, MAGIC, VERSION, width, height, self.pitch, slots)
+        (self._sequences, self._frames) = _views(self._memory.buf, slots, height, self.pitch)
+        self._sequences[:] = 0
+        self.sequence = 0
+
+    @classmethod
+    def for_surface(cls, surface, name=DEFAULT_NAME, slots=4):
+        """Return a ring sized for frames of surface, such as a game's display."""
+        return cls(surface.get_size(), name, slots)
+
+    @property
+    def name(self):
+        """The shared memory name readers attach to."""
+        return self._memory.name
+
+    def publish(self, surface):
+        """Copy surface into the next slot and make it the latest frame."""
+        self.sequence += 1
+        slot = self.sequence % self.slots
+        self._sequences[slot + 1] = 0
+        pixels = pygame.image.tobytes(surface, 'RGBX')
+        self._frames[slot].reshape(-1)[:] = np.frombuffer(pixels, dtype=np.uint8)
+        self._sequences[slot + 1] = self.sequence
+        self._sequences[0] = self.sequence
+
+    def close(self):
+        """Detach and remove the shared memory."""
+        del self._sequences, self._frames
+        self._memory.close()
+        self._memory.unlink()
+
+
+class SharedFrameReader:
+    """Read the frames a SharedFrameBuffer publishes, from any local process."""
+
+    def __init__(self, name=DEFAULT_NAME):
+        self._memory = shared_memory.SharedMemory(name)
+        # Only the process that created the block may unlink it.
+        # pylint: disable-next=protected-access
+        resource_tracker.unregister(self._memory._name, 'shared_memory')
+        (magic, version, width, height, self.pitch, self.slots) = HEADER.unpack_from(
+            self._memory.buf
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{name} is not a version {VERSION} frame buffer')
+        self.size = (width, height)
+        (self._sequences, self._frames) = _views(self._memory.buf, self.slots, height, self.pitch)
+
+    @property
+    def sequence(self):
+        """Sequence number of the latest published frame, 0 before the first."""
+        return int(self._sequences[0])
+
+    def new_frame(self):
+        """Return an array latest() can copy frames into."""
+        (width, height) = self.size
+        return np.zeros((height, width, 4), dtype=np.uint8)
+
+    def latest(self, out=None):
+        """Copy the latest frame into out and return (sequence, out)."""
+        if out is None:
+            out = self.new_frame()
+        (width, _) = self.size
+        while True:
+            sequence = self.sequence
+            if sequence == 0:
+                return (0, out)
+            slot = sequence % self.slots
+            if self._sequences[slot + 1] != sequence:
+                continue
+            out.reshape(out.shape[0], -1)[:] = self._frames[slot, :, :width * 4]
+            if self._sequences[slot + 1] == sequence:
+                return (sequence, out)
+
+    def wait(self, after, timeout=1.0, out=None):
+        """Wait for a frame newer than sequence after; return latest() or None on timeout."""
+        deadline = time.monotonic() + timeout
+        while self.sequence <= after:
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.001)
+        return self.latest(out)
+
+    def close(self):
+        """Detach from the shared memory."""
+        del self._sequences, self._frames
+        self._memory.close()
@@ -4,10 +4,26 @@
 
 """Game objects to create PyGame based games."""
 
+import functools
+import os
+import time
 import warnings
 import pygame
+import assets
+import profiler
 import rgbcolors
 import scene
+import simclock
+
+# Wall-clock milliseconds of simulation run per drawn frame in fast-forward.
+FAST_FORWARD_BUDGET_MS = 15
+
+# Keys that drive the simulation clock in any scene.
+PAUSE_KEY = pygame.K_p
+STEP_KEY = pygame.K_n
+SLOWER_KEY = pygame.K_MINUS
+FASTER_KEY = pygame.K_EQUALS
+FAST_FORWARD_KEY = pygame.K_f
 
 def display_info():
     """Print out information about the display driver and video information."""
@@ -30,8 +46,15 @@ class VideoGame:
         window_width=600,
         window_height=600,
         window_title="Space Invaders",
+        headless=False,
+        frame_profiler=None,
     ):
         """Initialize a new game with the given window size and window title."""
+        self._headless = headless
+        self._profiler = frame_profiler or profiler.NullProfiler()
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self._window_size = (window_width, window_height)
         self._clock = pygame.time.Clock()
@@ -44,6 +67,65 @@ class VideoGame:
         if not pygame.mixer:
             warnings.warn("Sound disabled.", RuntimeWarning)
         self._scene_graph = None
+        self._frame_sinks = []
+        self._sim_clock = simclock.SimClock()
+        self.asset_stats = None
+
+    def add_frame_sink(self, sink):
+        """Hand every rendered frame to sink."""
+        self._frame_sinks.append(sink)
+
+    def publish_frame(self):
+        """Give the frame just shown to every frame sink."""
+        for sink in self._frame_sinks:
+            sink.publish(self._screen)
+
+    def close_frame_sinks(self):
+        """Close every frame sink."""
+        for sink in self._frame_sinks:
+            sink.close()
+        self._frame_sinks = []
+
+    def quit(self):
+        """Close the frame sinks and shut pygame down, keeping the asset cache stats."""
+        self.close_frame_sinks()
+        self.asset_stats = assets.cache.stats()
+        assets.clear()
+        pygame.quit()
+
+    @property
+    def sim_clock(self):
+        """Return the simclock.SimClock that paces the game loop."""
+        return self._sim_clock
+
+    def clock_key(self, event):
+        """Apply a clock key to the simulation clock; return True if event was one."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        sim_clock = self._sim_clock
+        if event.key == PAUSE_KEY:
+            sim_clock.toggle_pause()
+        elif event.key == STEP_KEY:
+            sim_clock.single_step()
+        elif event.key == SLOWER_KEY:
+            sim_clock.scale(0.5)
+        elif event.key == FASTER_KEY:
+            sim_clock.scale(2)
+        elif event.key == FAST_FORWARD_KEY:
+            sim_clock.toggle_fast_forward()
+        else:
+            return False
+        return True
+
+    @property
+    def screen(self):
+        """Return the display surface every scene draws on."""
+        return self._screen
+
+    @property
+    def window_size(self):
+        """Return the (width, height) of the game window."""
+        return self._window_size
 
     @property
     def scene_graph(self):
@@ -62,15 +144,26 @@ class VideoGame:
 class SpaceInvaders(VideoGame):
     """Show a colored window with a colored message and a polygon."""
 
-    def __init__(self):
-        """Init the Pygame demo."""
-        super().__init__(window_title="Space Invaders")
+    def __init__(self, headless=False, frame_profiler=None, seed=None, score_store=None):
+        """Init the Pygame demo; seed makes the battle reproducible."""
+        super().__init__(
+            window_title="Space Invaders",
+            headless=headless,
+            frame_profiler=frame_profiler,
+        )
+        self._seed = seed
+        self._score_store = score_store
         self._scene_graph = scene.SceneManager()
         self.build_scene_graph()
 
+    @property
+    def battle_scene(self):
+        """Return the scene where the game is played, building it if need be."""
+        return self._scene_graph.get('1')
+
     def build_scene_graph(self):
         """Build scene graph for the game demo."""
-        background_image = pygame.image.load("videogame/data/photo-1534796636912-3b95b3ab5986.jpeg").convert()
+        background_image = assets.image('background', alpha=False)
         self._scene_graph.add(
             [
                 scene.Title(
@@ -81,32 +174,85 @@ class SpaceInvaders(VideoGame):
                     72,
                     background_image,
                 ),
-            scene.BattleScene(self._screen, background_image),
+            functools.partial(
+                scene.BattleScene,
+                self._screen,
+                background_image,
+                self._seed,
+                self._sim_clock,
+                self._scene_graph,
+                self._score_store,
+            ),
             ]
         )
         self._scene_graph.set_next_scene('0')
 
+    def view_replay(self, replay_file, frame=0):
+        """Open on a scene.ReplayViewer of replay_file instead of the title."""
+        self._scene_graph.add(
+            [scene.ReplayViewer(self._screen, self.battle_scene, replay_file, frame)]
+        )
+        self._scene_graph.set_next_scene('0')
+
     def run(self):
-        """Run the game; the main game loop."""
+        """Run the game; the main game loop, stepping scenes at a fixed rate."""
+        sim_clock = self._sim_clock
         scene_iterator = iter(self.scene_graph)
         current_scene = next(scene_iterator)
         while not self._game_is_over:
             current_scene.start_scene()
+            sim_clock.start(current_scene.tick_rate())
             while current_scene.is_valid():
                 current_scene.delta_time = self._clock.tick(
-                    current_scene.frame_rate()
+                    0 if sim_clock.uncapped else current_scene.frame_rate()
                 )
-                for event in pygame.event.get():
-                    current_scene.process_event(event)
-                current_scene.update_scene()
+                sim_clock.accumulate(current_scene.delta_time)
+                self._profiler.start()
+                events = pygame.event.get()
+                self._profiler.mark('events')
+                for event in events:
+                    if not self.clock_key(event):
+                        current_scene.process_event(event)
+                self._profiler.mark('process_event')
+                if sim_clock.uncapped:
+                    deadline = time.perf_counter() + FAST_FORWARD_BUDGET_MS / 1000
+                    while current_scene.is_valid() and time.perf_counter() < deadline:
+                        current_scene.update_scene()
+                else:
+                    for _ in range(sim_clock.steps_due()):
+                        if not current_scene.is_valid():
+                            break
+                        current_scene.update_scene()
+                current_scene.interpolation = sim_clock.interpolation
+                self._profiler.mark('update_scene')
                 current_scene.draw()
-                current_scene.render_updates()
-                pygame.display.update()
+                self._profiler.mark('draw')
+                pygame.display.update(current_scene.render_updates())
+                self._profiler.mark('display_update')
+                self.publish_frame()
+                self._profiler.mark('frame_sinks')
             current_scene.end_scene()
             try:
                 current_scene = next(scene_iterator)
             except StopIteration:
                 self._game_is_over = True
-        pygame.quit()
+        self.quit()
         return 0
-    
\ No newline at end of file
+
+    def run_headless(self, max_frames=None):
+        """Simulate the battle as fast as possible without drawing anything."""
+        current_scene = self.battle_scene
+        start = time.perf_counter()
+        while current_scene.is_valid() and current_scene.frames != max_frames:
+            self._profiler.start()
+            events = pygame.event.get()
+            self._profiler.mark('events')
+            for event in events:
+                current_scene.process_event(event)
+            self._profiler.mark('process_event')
+            current_scene.update_scene()
+            self._profiler.mark('update_scene')
+        result = current_scene.result()
+        result['seconds'] = time.perf_counter() - start
+        self.quit()
+        return result
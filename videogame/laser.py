@@ -2,25 +2,117 @@
 # nguyen.bradon771@csu.fullerton.edu
 # @brandonnguyenr
 
-"""Laser class to create a laser."""
+"""Lasers stored as arrays so thousands of them can be simulated at once."""
 
+import numpy as np
 import pygame
 
-class Laser(pygame.sprite.Sprite):
-    """Laser class to create the lasers."""
-    def __init__(self, pos, speed, height):
-        super().__init__()
-        self.image = pygame.Surface((4, 20))
-        self.image.fill('white')
-        self.rect = self.image.get_rect(center = pos)
-        self.speed = speed
-        self.border_y = height
-
-    def destroy(self):
-        """Destroy laser on contact."""
-        if self.rect.y <= -50 or self.rect.y >= self.border_y + 50:
-            self.kill()
+PLAYER = 0
+ALIEN = 1
+
+FIELDS = ('x', 'y', 'vx', 'vy', 'owner', 'alive', 'previous_x', 'previous_y')
+
+
+class Lasers:
+    """Every laser in a battle as a struct of arrays."""
+
+    def __init__(self, bounds, capacity=64, size=(4, 20), color='white', margin=50):
+        self.image = pygame.Surface(size)
+        self.image.fill(color)
+        (self.w, self.h) = size
+        self.bounds = pygame.Rect(bounds).inflate(0, 2 * margin)
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.vx = np.zeros(capacity, dtype=np.int32)
+        self.vy = np.zeros(capacity, dtype=np.int32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.previous_x = np.zeros(capacity, dtype=np.int32)
+        self.previous_y = np.zeros(capacity, dtype=np.int32)
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def _grow(self):
+        capacity = len(self.alive)
+        for name in FIELDS:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+
+    def clear(self):
+        """Remove every laser, keeping the arrays at their current capacity."""
+        self.alive[:] = False
+        self._free = list(range(len(self.alive) - 1, -1, -1))
+
+    def free_slots(self):
+        """Return the free list, next slot to reuse last, as an array."""
+        return np.array(self._free, dtype=np.int32)
+
+    def set_state(self, arrays, free_slots):
+        """Overwrite every laser with arrays (one per FIELDS name) and free_slots."""
+        for (name, saved) in zip(FIELDS, arrays):
+            array = getattr(self, name)
+            if len(array) == len(saved):
+                array[:] = saved
+            else:
+                setattr(self, name, saved.copy())
+        self._free = free_slots.tolist()
+
+    def fire(self, pos, vx, vy, owner):
+        """Launch a laser centered on pos and return its slot."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.x[slot] = self.previous_x[slot] = pos[0] - self.w // 2
+        self.y[slot] = self.previous_y[slot] = pos[1] - self.h // 2
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.owner[slot] = owner
+        self.alive[slot] = True
+        return slot
+
+    def kill(self, slots):
+        """Remove the lasers in slots; dead slots are ignored."""
+        slots = np.asarray(slots, dtype=np.intp)
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        self._free.extend(slots.tolist())
 
     def update(self):
-        """Update laser speed."""
-        self.rect.y += self.speed
+        """Move every laser one step and cull those that left the screen."""
+        self.previous_x[:] = self.x
+        self.previous_y[:] = self.y
+        self.x += self.vx
+        self.y += self.vy
+        bounds = self.bounds
+        self.kill(np.flatnonzero(
+            self.alive
+            & ((self.y <= bounds.top) | (self.y >= bounds.bottom)
+               | (self.x + self.w <= bounds.left) | (self.x >= bounds.right))
+        ))
+
+    def of(self, owner):
+        """Return the slots of every alive laser fired by owner."""
+        return np.flatnonzero(self.alive & (self.owner == owner))
+
+    def overlapping(self, owner, rect):
+        """Return the slots of owner's alive lasers that overlap rect."""
+        return np.flatnonzero(
+            self.alive & (self.owner == owner)
+            & (self.x < rect.right) & (self.x + self.w > rect.left)
+            & (self.y < rect.bottom) & (self.y + self.h > rect.top)
+        )
+
+    def rect(self, slot):
+        """Return the screen rect of one laser."""
+        return pygame.Rect(int(self.x[slot]), int(self.y[slot]), self.w, self.h)
+
+    def blit_sequence(self, alpha=1.0):
+        """Return (image, position) pairs placing every laser alpha of the way through its step."""
+        slots = np.flatnonzero(self.alive)
+        x = self.previous_x[slots] + (self.x[slots] - self.previous_x[slots]) * alpha
+        y = self.previous_y[slots] + (self.y[slots] - self.previous_y[slots]) * alpha
+        image = self.image
+        return [(image, position) for position in zip(x.tolist(), y.tolist())]
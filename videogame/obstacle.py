@@ -4,15 +4,9 @@
 
 """Obstacle class to create blocking obstacles."""
 
+import numpy as np
 import pygame
-
-class Shield(pygame.sprite.Sprite):
-    """Create the shields."""
-    def __init__(self, size, color, x, y):
-        super().__init__()
-        self.image = pygame.Surface((size, size))
-        self.image.fill(color)
-        self.rect = self.image.get_rect(topleft = (x, y))
+import assets
 
 shape = [
 '  xxxxxxx',
@@ -23,30 +17,78 @@ shape = [
 'xxx     xxx',
 'xx       xx']
 
-class Alien(pygame.sprite.Sprite):
-    """Create the aliens."""
-    def __init__(self, color, x, y):
+class Bunker(pygame.sprite.Sprite):
+    """A whole shield as one surface and one bitmap mask."""
+    def __init__(self, size, color, x, y, pattern=None):
         super().__init__()
-        file_path = 'videogame/data/' + color + '.png'
-        self.image = pygame.image.load(file_path).convert_alpha()
-        self.rect = self.image.get_rect(topleft=(x, y))
-
-        if color == 'red':
-            self.value = 100
-        elif color == 'green':
-            self.value = 200
-        else:
-            self.value = 300
+        pattern = pattern or shape
+        self.size = size
+        self.color = color
+        width = max(len(row) for row in pattern)
+        self.blocks = np.array(
+            [[col == 'x' for col in row.ljust(width)] for row in pattern], dtype=bool
+        )
+        self.pattern_blocks = self.blocks.copy()
+        self.mask = pygame.mask.Mask((width * size, len(pattern) * size))
+        self._draw_blocks()
+        self.full = self.mask.count()
+        self.image = self.mask.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0))
+        self.rect = self.image.get_rect(topleft = (x, y))
+
+    def _draw_blocks(self):
+        """Rebuild the bitmap from the block grid."""
+        self.mask.clear()
+        block = pygame.mask.Mask((self.size, self.size), fill=True)
+        for (row_index, col_index) in np.argwhere(self.blocks).tolist():
+            self.mask.draw(block, (col_index * self.size, row_index * self.size))
+
+    def set_blocks(self, blocks):
+        """Make the bunker match a block grid saved earlier; return True if it changed."""
+        if np.array_equal(self.blocks, blocks):
+            return False
+        self.blocks[:] = blocks
+        self._draw_blocks()
+        self.mask.to_surface(self.image, setcolor=self.color, unsetcolor=(0, 0, 0, 0))
+        return True
+
+    def reset(self):
+        """Rebuild the bunker undamaged; return True if it had been hit."""
+        return self.set_blocks(self.pattern_blocks)
+
+    def coverage(self):
+        """Return the fraction of the bunker still standing."""
+        return self.mask.count() / self.full
+
+    def _cells(self, rect):
+        """Return the part of the bunker under rect, grown to whole blocks."""
+        local = rect.move(-self.rect.x, -self.rect.y).clip(self.image.get_rect())
+        left = local.left // self.size * self.size
+        top = local.top // self.size * self.size
+        right = -(-local.right // self.size) * self.size
+        bottom = -(-local.bottom // self.size) * self.size
+        return pygame.Rect(left, top, right - left, bottom - top)
 
-    def update(self, direction):
-        """Update alien movements."""
-        self.rect.x += direction
+    def erode(self, rect):
+        """Clear the blocks under rect; return the screen area changed, or None."""
+        if not self.rect.colliderect(rect):
+            return None
+        cells = self._cells(rect)
+        area = pygame.mask.Mask(cells.size, fill=True)
+        if self.mask.overlap(area, cells.topleft) is None:
+            return None
+        self.mask.erase(area, cells.topleft)
+        size = self.size
+        self.blocks[
+            cells.top // size:cells.bottom // size, cells.left // size:cells.right // size
+        ] = False
+        self.image.fill((0, 0, 0, 0), cells)
+        return cells.move(self.rect.topleft)
 
 class Top_Alien(pygame.sprite.Sprite):
     """Speedy alien at the top worth the most points."""
     def __init__(self, side, w):
         super().__init__()
-        self.image = pygame.image.load('videogame/data/extra.png').convert_alpha()
+        self.image = assets.image('extra')
         if side == 'right':
             x = w + 50
             self.speed = -3
@@ -54,6 +96,7 @@ class Top_Alien(pygame.sprite.Sprite):
             x = -50
             self.speed = 3
         self.rect = self.image.get_rect(topleft=(x, 80))
+        self.previous_pos = self.rect.topleft
 
     def update(self):
         """Updates on the top alien."""
@@ -6,23 +6,44 @@
 
 """pylint reading lots of errors on this page but, errors are nonexistent on page."""
 import pygame
-from laser import Laser
+import assets
+import laser
+import replay
+import simclock
 
 class Player(pygame.sprite.Sprite):
     """Create player sprite."""
-    def __init__(self, pos, border, speed):
+    def __init__(self, pos, border, speed, lasers=None, clock=None):
         super().__init__()
-        self.image = pygame.image.load('videogame/data/player.png').convert_alpha()
+        self.image = assets.image('player')
+        self.start = pos
         self.rect = self.image.get_rect(midbottom = pos)
+        self.previous_pos = self.rect.topleft
         self.speed = speed
         self.max_x_border = border
         self.ready = True
-        self.laser_time = 0
-        self.laser_cooldown = 400
-        self.lasers = pygame.sprite.Group()
-        self.laser_sound = pygame.mixer.Sound('videogame/data/laser.wav')
+        # Counted in simulation steps so replays are deterministic;
+        # 24 steps is 400 ms at 60 steps per second. Without the scene's
+        # clock the player keeps and advances one of its own.
+        self.laser_cooldown = 24
+        self._own_clock = clock is None
+        self.clock = simclock.SimClock() if clock is None else clock
+        self.timers = self.clock.timers
+        self.timers.register('player_ready', self.reload)
+        self.cooldown_timer = None
+        if lasers is None:
+            lasers = laser.Lasers(pygame.Rect(0, 0, border, self.rect.bottom))
+        self.lasers = lasers
+        self.laser_sound = assets.sound('laser')
         self.laser_sound.set_volume(0.5)
 
+    def reset(self):
+        """Put the player back at the start, ready to fire."""
+        self.rect.midbottom = self.start
+        self.previous_pos = self.rect.topleft
+        self.ready = True
+        self.cooldown_timer = None
+
     def border(self):
         """Boundaries of the player."""
         if self.rect.left <= 0:
@@ -30,37 +51,37 @@ class Player(pygame.sprite.Sprite):
         if self.rect.right >= self.max_x_border:
             self.rect.right = self.max_x_border
 
-    def get_input(self):
-        """Player movement with keys."""
-        keys = pygame.key.get_pressed()
-
-        if keys[pygame.K_d]:
+    def get_input(self, controls):
+        """Player movement from a replay.MOVE_*/FIRE controls byte."""
+        if controls & replay.MOVE_RIGHT:
             self.rect.x += self.speed
-        elif keys[pygame.K_a]:
+        elif controls & replay.MOVE_LEFT:
             self.rect.x -= self.speed
-        if keys[pygame.K_SPACE]:
+        if controls & replay.FIRE:
             self.shooting()
-            self.ready = False
-            self.laser_time = pygame.time.get_ticks()
+            self.cooldown()
             self.laser_sound.play()
 
     def cooldown(self):
-        """Cooldown on shots so you cant spam."""
-        if not self.ready:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.laser_time >= self.laser_cooldown:
-                self.ready = True
+        """Cooldown on shots so you cant spam; pressing fire again restarts it."""
+        self.ready = False
+        if self.cooldown_timer:
+            self.timers.cancel(self.cooldown_timer)
+        self.cooldown_timer = self.timers.schedule('player_ready', self.laser_cooldown)
+
+    def reload(self):
+        """Timer callback ending the cooldown."""
+        self.ready = True
+        self.cooldown_timer = None
 
     def shooting(self):
         """Player shooting speed."""
         if self.ready:
-            self.lasers.add(Laser(self.rect.center, -8, self.rect.bottom))
-            self.ready = False
-            self.laser_time = pygame.time.get_ticks()
+            self.lasers.fire(self.rect.center, 0, -8, laser.PLAYER)
 
-    def update(self):
+    def update(self, controls):
         """Updates on the players."""
-        self.get_input()
+        self.get_input(controls)
         self.border()
-        self.cooldown()
-        self.lasers.update()
+        if self._own_clock:
+            self.clock.advance()
@@ -0,0 +1,66 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Frame profiler that attributes each frame's time to the phases of the game loop."""
+
+import time
+from collections import deque
+
+PHASES = ('events', 'process_event', 'update_scene', 'draw', 'display_update', 'frame_sinks')
+
+
+class NullProfiler:
+    """Profiler that records nothing; used when profiling is switched off."""
+
+    def start(self):
+        """Start timing a frame."""
+
+    def mark(self, phase):
+        """Close the current phase."""
+
+    def summary(self):
+        """Return an empty summary."""
+        return ''
+
+
+class FrameProfiler(NullProfiler):
+    """Keep a rolling window of timings for every phase of the game loop."""
+
+    def __init__(self, window=600):
+        self._samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self._frames = 0
+        self._last = 0.0
+
+    def start(self):
+        """Start timing a frame."""
+        self._frames += 1
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        """Record the time spent since the previous mark as phase."""
+        now = time.perf_counter()
+        self._samples[phase].append(now - self._last)
+        self._last = now
+
+    def percentiles(self, phase, quantiles=(50, 90, 99)):
+        """Return a dict of quantile to milliseconds for phase."""
+        samples = sorted(self._samples[phase])
+        if not samples:
+            return {q: 0.0 for q in quantiles}
+        last = len(samples) - 1
+        return {q: samples[round(q / 100 * last)] * 1000 for q in quantiles}
+
+    def summary(self):
+        """Return a table of per-phase percentiles over the rolling window."""
+        lines = [
+            f'Frame profile ({self._frames} frames, '
+            f'last {len(self._samples[PHASES[0]])} shown, milliseconds)',
+            f"{'phase':<16}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}",
+        ]
+        for phase in PHASES:
+            p = self.percentiles(phase, (50, 90, 99, 100))
+            lines.append(
+                f'{phase:<16}{p[50]:>8.3f}{p[90]:>8.3f}{p[99]:>8.3f}{p[100]:>8.3f}'
+            )
+        return '\n'.join(lines)
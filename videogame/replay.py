@@ -0,0 +1,167 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Record the per-frame input of a battle and play it back without a keyboard."""
+
+import struct
+import zlib
+import numpy as np
+import pygame
+
+# Bits of the controls byte that drives one simulation step.
+MOVE_RIGHT = 1
+MOVE_LEFT = 2
+FIRE = 4
+
+MAGIC = b'SIRP'
+
+# Replay containers: header, then per keyframe its snapshot and the input
+# of the frames up to the next keyframe, then an index and a trailer.
+# Version 4 added the formation's rows and columns to the header.
+CONTAINER_VERSION = 4
+CONTAINER_HEADER = struct.Struct('<4sHQIHH')
+INDEX_ENTRY = struct.Struct('<QIiQII')
+TRAILER = struct.Struct('<QI4s')
+INDEX_MAGIC = b'SIRX'
+KEYFRAME_INTERVAL = 600
+FULL_KEYFRAME_EVERY = 8
+
+
+def keyboard_controls():
+    """Return the controls byte for the keys held down right now."""
+    keys = pygame.key.get_pressed()
+    controls = 0
+    if keys[pygame.K_d]:
+        controls |= MOVE_RIGHT
+    if keys[pygame.K_a]:
+        controls |= MOVE_LEFT
+    if keys[pygame.K_SPACE]:
+        controls |= FIRE
+    return controls
+
+
+def xor(data, base):
+    """Return the bytewise XOR of two equally long byte strings."""
+    return np.bitwise_xor(
+        np.frombuffer(data, dtype=np.uint8), np.frombuffer(base, dtype=np.uint8)
+    ).tobytes()
+
+
+class ReplayWriter:
+    """Write a replay container: per-frame controls plus periodic keyframes."""
+
+    def __init__(self, path, seed, interval=KEYFRAME_INTERVAL, formation=(6, 8)):
+        self._file = open(path, 'wb')
+        self._file.write(
+            CONTAINER_HEADER.pack(MAGIC, CONTAINER_VERSION, seed, interval, *formation)
+        )
+        self.interval = interval
+        self._index = []
+        self._inputs = bytearray()
+        self._full = None
+
+    def keyframe(self, battle):
+        """Store battle's state if it is at a keyframe; called before every step."""
+        if battle.frames % self.interval:
+            return
+        self._flush_inputs()
+        number = len(self._index)
+        data = battle.snapshot()
+        base = -1
+        if number % FULL_KEYFRAME_EVERY == 0 or len(data) != len(self._full[1]):
+            self._full = (number, data)
+        else:
+            (base, full) = self._full
+            data = xor(data, full)
+        compressed = zlib.compress(data)
+        self._index.append([self._file.tell(), len(compressed), base, 0, 0, 0])
+        self._file.write(compressed)
+
+    def record(self, controls):
+        """Append the controls of one simulation step."""
+        self._inputs.append(controls)
+
+    def _flush_inputs(self):
+        if self._index:
+            compressed = zlib.compress(bytes(self._inputs))
+            self._index[-1][3:] = (self._file.tell(), len(compressed), len(self._inputs))
+            self._file.write(compressed)
+        self._inputs.clear()
+
+    def close(self):
+        """Write the last inputs, the index and the trailer, then close the file."""
+        if self._file.closed:
+            return
+        self._flush_inputs()
+        index_offset = self._file.tell()
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+        self._file.write(TRAILER.pack(index_offset, len(self._index), INDEX_MAGIC))
+        self._file.close()
+
+
+class ReplayFile:
+    """Play back and seek in a container written by ReplayWriter."""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        (magic, version, self.seed, self.interval, rows, cols) = CONTAINER_HEADER.unpack(
+            self._file.read(CONTAINER_HEADER.size)
+        )
+        if magic != MAGIC or version != CONTAINER_VERSION:
+            raise ValueError(f'{path} is not a version {CONTAINER_VERSION} replay')
+        self.formation = (rows, cols)
+        self._file.seek(-TRAILER.size, 2)
+        (index_offset, count, index_magic) = TRAILER.unpack(self._file.read(TRAILER.size))
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f'{path} has no index; was it closed?')
+        self._file.seek(index_offset)
+        self._index = list(INDEX_ENTRY.iter_unpack(self._file.read(count * INDEX_ENTRY.size)))
+        self.frames = sum(entry[5] for entry in self._index)
+        self.frame = 0
+        self._block = None
+        self._block_number = -1
+
+    @property
+    def finished(self):
+        """True once every recorded step has been read."""
+        return self.frame >= self.frames
+
+    def _read(self, offset, length):
+        self._file.seek(offset)
+        return zlib.decompress(self._file.read(length))
+
+    def keyframe(self, number):
+        """Return the snapshot stored as keyframe number."""
+        (offset, length, base, _, _, _) = self._index[number]
+        data = self._read(offset, length)
+        if base >= 0:
+            data = xor(data, self.keyframe(base))
+        return data
+
+    def read(self):
+        """Return the controls of the next simulation step, 0 once finished."""
+        if self.finished:
+            return 0
+        (number, position) = divmod(self.frame, self.interval)
+        if number != self._block_number:
+            (_, _, _, offset, length, _) = self._index[number]
+            self._block = self._read(offset, length)
+            self._block_number = number
+        self.frame += 1
+        return self._block[position]
+
+    def seek(self, battle, frame):
+        """Put battle, whose replay is this file, at frame (clamped to the recording)."""
+        frame = max(0, min(frame, self.frames))
+        number = min(frame // self.interval, len(self._index) - 1)
+        battle.restore(self.keyframe(number))
+        self.frame = battle.frames
+        while battle.frames < frame:
+            battle.update_scene()
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
@@ -4,16 +4,19 @@
 
 """Scene objects for making games with PyGame."""
 
-import sys
+import random
 import pygame.mixer
 import pygame
+import numpy as np
+import assets
 import rgbcolors
 from player import Player
-from random import choice, randint
-from laser import Laser
+import laser
+import replay
+import snapshot
 import obstacle
-import pickle
-from datetime import datetime
+import simclock
+from formation import AlienFormation
 
 
 # If you're interested in using abstract base classes, feel free to rewrite
@@ -25,7 +28,6 @@ class SceneManager:
     """Scene Manageers that manages all the scenes."""
     def __init__(self):
         self._scene_dict = {}
-        self._current_scene = None
         self._next_scene = None
         # This is a safety to ensure that calling
         # next() twice in a row without calling set_next_scene()
@@ -34,14 +36,20 @@ class SceneManager:
 
     def set_next_scene(self, key):
         """Next Scene."""
-        self._next_scene = self._scene_dict[key]
+        self._next_scene = self.get(key)
         self._reloaded = True
 
     def add(self, scene_list):
-        """Add.scene"""
+        """Add scenes, or factories building them, keyed by position."""
         for (index, scene) in enumerate(scene_list):
             self._scene_dict[str(index)] = scene
-        self._current_scene = self._scene_dict['0']
+
+    def get(self, key):
+        """Return the scene stored under key, building it first if needed."""
+        scene = self._scene_dict[key]
+        if not isinstance(scene, Scene):
+            scene = self._scene_dict[key] = scene()
+        return scene
 
     def __iter__(self):
         """Return self."""
@@ -61,16 +69,48 @@ class Scene:
     def __init__(self, screen, soundtrack=None):
         """Scene initializer"""
         self._screen = screen
-        #https://unsplash.com/images/nature/space : website used to grab this background - 6-27-2023
-        self._background = pygame.image.load("videogame/data/photo-1534796636912-3b95b3ab5986.jpeg").convert()
+        self._background = assets.image('background', alpha=False)
         self._frame_rate = 60
+        self._tick_rate = 60
+        self.interpolation = 1.0
         self._is_valid = True
         self._soundtrack = soundtrack
-        self._render_updates = None
+        # Everything that does not move is painted on the backdrop; moving
+        # things are blitted over it and erased again on the next frame.
+        self._backdrop = self._background
+        self._full_redraw = True
+        self._erased_rects = []
+        self._drawn_rects = []
+
+    def blit(self, surface, dest):
+        """Blit surface to the screen and remember the area as dirty."""
+        rect = self._screen.blit(surface, dest)
+        self._drawn_rects.append(rect)
+        return rect
+
+    def blits(self, blit_sequence):
+        """Blit many (surface, dest) pairs and remember the areas as dirty."""
+        rects = self._screen.blits(blit_sequence)
+        self._drawn_rects.extend(rects)
+        return rects
+
+    def invalidate(self, rect=None):
+        """Mark an area, or the whole screen, as needing a redraw."""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._screen.blit(self._backdrop, rect, rect)
+            self._erased_rects.append(pygame.Rect(rect))
 
     def draw(self):
         """Draw the scene."""
-        self._screen.blit(self._background, (0, 0))
+        if self._full_redraw:
+            self._screen.blit(self._backdrop, (0, 0))
+        else:
+            for rect in self._drawn_rects:
+                self._screen.blit(self._backdrop, rect, rect)
+            self._erased_rects.extend(self._drawn_rects)
+        self._drawn_rects = []
 
     def process_event(self, event):
         """Process a game event by the scene."""
@@ -88,16 +128,24 @@ class Scene:
         return self._is_valid
 
     def render_updates(self):
-        """Render all sprite updates."""
+        """Return the screen areas changed by the last draw()."""
+        if self._full_redraw:
+            self._full_redraw = False
+            self._erased_rects = []
+            return [self._screen.get_rect()]
+        dirty = self._erased_rects + self._drawn_rects
+        self._erased_rects = []
+        return dirty
 
     def update_scene(self):
         """Update the scene state."""
 
     def start_scene(self):
         """Start the scene."""
+        self.invalidate()
         if self._soundtrack:
             try:
-                pygame.mixer.music.load('videogame/data/Visager_-_15_-_Epilogue.mp3')
+                pygame.mixer.music.load(assets.get('soundtrack'))
                 pygame.mixer.music.set_volume(0.5)
             except pygame.error as pygame_error:
                 print("\n".join(pygame_error.args))
@@ -114,6 +162,10 @@ class Scene:
         """Return the frame rate the scene desires."""
         return self._frame_rate
 
+    def tick_rate(self):
+        """Return how many times per second update_scene() should run."""
+        return self._tick_rate
+
 
 class PressAnyKeyToExitScene(Scene):
     """Empty scene where it will invalidate when a key is pressed."""
@@ -126,17 +178,39 @@ class PressAnyKeyToExitScene(Scene):
 
 class BattleScene(Scene):
     """Everything that happens in the Battle Scene."""
-    def __init__(self, screen, background_color):
+    # 800 ms between alien shots at 60 steps per second.
+    ALIEN_FIRE_STEPS = 48
+
+    def __init__(
+        self, screen, background_color, seed=None, clock=None, scene_manager=None,
+        score_store=None,
+    ):
         super().__init__(screen, background_color)
+        self._scene_manager = scene_manager
+        self.score_store = score_store
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.recorder = None
+        self.replay = None
+        self.controller = None
+        self.game_over = False
+        self.frames = 0
+        self.clock = simclock.SimClock(self._tick_rate) if clock is None else clock
+        self.timers = self.clock.timers
+        self.timers.register('alien_fire', self.alien_shoot)
+        self.timers.register('top_alien', self.top_dog_alien)
         (w, h) = self._screen.get_size()
-        player_sprite = Player((w / 2, h), w, 5)
+        self.lasers = laser.Lasers(self._screen.get_rect())
+        player_sprite = Player((w / 2, h), w, 5, self.lasers, self.clock)
         self.player = pygame.sprite.GroupSingle(player_sprite)
 
-        self.lives = 3
-        self.live_surf = pygame.image.load('videogame/data/player.png').convert_alpha()
+        self.starting_lives = 3
+        self.lives = self.starting_lives
+        self.live_surf = assets.image('player')
         self.live_x_start_pos = w - self.live_surf.get_size()[0] * 2 - 90
         self.score = 0
-        self.font = pygame.font.Font('videogame/data/Pixeled.ttf', 20)
 
         self.shape = obstacle.shape
         self.shield_size = 6
@@ -144,199 +218,336 @@ class BattleScene(Scene):
         self.obstacle_num = 4
         self.obstacle_x_pos = [num * (w / self.obstacle_num) for num in range(self.obstacle_num)]
         self.create_multi_obs(*self.obstacle_x_pos, x_start = w / 15, y_start = 480)
+        self._backdrop = self._background.copy()
+        self.shields.draw(self._backdrop)
+
+        self.shield_area = self.shields.sprites()[0].rect.unionall(
+            [bunker.rect for bunker in self.shields]
+        )
 
-        self.aliens = pygame.sprite.Group()
         self.alien_setup(rows = 6, cols = 8)
-        self.alien_direction = 1
-        self.alien_lasers = pygame.sprite.Group()
 
         self.top = pygame.sprite.Group()
-        self.top_alien_time = randint(40, 80)
+        self.schedule_timers()
 
-        pygame.mixer.music.load('videogame/data/Visager_-_15_-_Epilogue.mp3')
-        self.explosion_sound = pygame.mixer.Sound('videogame/data/explosion.wav')
-        self.laser_sound = pygame.mixer.Sound('videogame/data/laser.wav')
+        self.explosion_sound = assets.sound('explosion')
+        self.laser_sound = assets.sound('laser')
         self.explosion_sound.set_volume(0.5)
         self.laser_sound.set_volume(0.5)
 
         self._next_key = '1'
 
+    def schedule_timers(self):
+        """Schedule the first top alien and the alien fire."""
+        self.timers.schedule('top_alien', self.rng.randint(40, 80))
+        self.timers.schedule('alien_fire', self.ALIEN_FIRE_STEPS, self.ALIEN_FIRE_STEPS)
+
+    def reset(self, seed=None):
+        """Start a new game in place, reusing every object and loaded asset."""
+        if seed is None:
+            seed = self.rng.randrange(2 ** 63)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.timers.set_state(0, 0, [])
+        self.frames = 0
+        self.game_over = False
+        self._is_valid = True
+        self.lives = self.starting_lives
+        self.score = 0
+        self.lasers.clear()
+        self.player.sprite.reset()
+        self.aliens.reset()
+        self.top.empty()
+        for bunker in self.shields:
+            if bunker.reset():
+                self._backdrop.blit(self._background, bunker.rect, bunker.rect)
+                self._backdrop.blit(bunker.image, bunker.rect)
+        self.schedule_timers()
+        self.invalidate()
+
     def alien_setup(self, rows, cols, x_distance = 60, y_distance = 48, x_offset = 70, y_offset = 100):
         """Place aliens in rows and colums on scene."""
-        for row_index, row in enumerate(range(rows)):
-            for col_index, col in enumerate(range(cols)):
-                x = col_index * x_distance + x_offset
-                y = row_index * y_distance + y_offset
-                if row_index == 0:
-                    alien_sprite = obstacle.Alien('yellow', x, y)
-                elif 1 <= row_index <= 2:
-                    alien_sprite = obstacle.Alien('green', x, y)
-                else:
-                    alien_sprite = obstacle.Alien('red', x, y)
-                self.aliens.add(alien_sprite)
+        self.aliens = AlienFormation(rows, cols, x_distance, y_distance, x_offset, y_offset)
 
     def create_obstacle(self, x_start, y_start, offset_x):
-        """Create all obstacles."""
-        for row_index, row in enumerate(self.shape):
-            for col_index, col in enumerate(row):
-                if col == 'x':
-                    x = x_start + col_index * self.shield_size + offset_x
-                    y = y_start + row_index * self.shield_size
-                    shield = obstacle.Shield(self.shield_size, rgbcolors.red, x, y)
-                    self.shields.add(shield)
+        """Create one shield bunker."""
+        self.shields.add(
+            obstacle.Bunker(
+                self.shield_size, rgbcolors.red, x_start + offset_x, y_start, self.shape
+            )
+        )
 
     def create_multi_obs(self, *offset, x_start, y_start):
         """Create multiple sets of the obstacles."""
         for offset_x in offset:
             self.create_obstacle(x_start, y_start, offset_x)
 
+    def hit_shields(self, rect):
+        """Erode the shield blocks overlapping rect; return True if any were hit."""
+        hit = False
+        for bunker in self.shields:
+            area = bunker.erode(rect)
+            if area:
+                self._backdrop.blit(self._background, area, area)
+                self.invalidate(area)
+                hit = True
+        return hit
+
+    def shoot_shields(self, owner):
+        """Let owner's lasers erode the shields they reach."""
+        for shot in self.lasers.overlapping(owner, self.shield_area).tolist():
+            if self.hit_shields(self.lasers.rect(shot)):
+                self.lasers.kill([shot])
+
+    def shoot_aliens(self):
+        """Destroy every alien hit by a player laser and return the points scored."""
+        shots = self.lasers.of(laser.PLAYER)
+        if shots.size == 0 or not self.aliens:
+            return 0
+        lasers = self.lasers
+        shots_hit = []
+        aliens_hit = []
+        for shot in shots.tolist():
+            aliens = self.aliens.overlapping(lasers.rect(shot))
+            if aliens.size:
+                shots_hit.append(shot)
+                aliens_hit.append(aliens)
+        if not shots_hit:
+            return 0
+        lasers.kill(shots_hit)
+        return self.aliens.kill(np.unique(np.concatenate(aliens_hit)))
+
     def alien_pos(self):
-        """Alien movement on screen."""
-        all_aliens = self.aliens.sprites()
+        """Turn the formation around and drop it once it reaches a side."""
         (w, h) = self._screen.get_size()
-        for alien in all_aliens:
-            if alien.rect.right >= w:
-                self.alien_direction = -1
-                self.alien_mov(2)
-            elif alien.rect.left <= 0:
-                self.alien_direction = 1
-                self.alien_mov(2)
-
-    def alien_mov(self, distance):
-        """Used in alien_pos to find movment position."""
-        if self.aliens:
-            for alien in self.aliens.sprites():
-                alien.rect.y += distance
+        self.aliens.check_edges(w, 2)
 
     def alien_shoot(self):
         """Alien laser shooting."""
-        if self.aliens.sprites():
-            (w, h) = self._screen.get_size()
-            random_alien = choice(self.aliens.sprites())
-            alien_laser = Laser(random_alien.rect.center, 6, h)
-            self.alien_lasers.add(alien_laser)
+        if self.aliens:
+            random_alien = self.rng.choice(self.aliens.alive_indices().tolist())
+            self.lasers.fire(self.aliens.rect(random_alien).center, 0, 6, laser.ALIEN)
             self.laser_sound.play()
 
-    def alien_timer(self, event):
-        """Alien timer to space out lasers."""
-        ALIEN_LASER = pygame.USEREVENT + 1
-        pygame.time.set_timer(ALIEN_LASER, 800)
-        if event.type == ALIEN_LASER:
-            self.alien_shoot()
-
     def top_dog_alien(self):
         """Alien at the top with the most points."""
         (w, h) = self._screen.get_size()
-        self.top_alien_time -= 1
-        if self.top_alien_time <= 0:
-            if len(self.top) == 0:
-                self.top.add(obstacle.Top_Alien(choice(['right', 'left']), w))
-            self.top_alien_time = randint(40, 80)
-
-    def process_event(self, event):
-        """Make the top alien rare."""
-        super().process_event(event)
-        self.alien_timer(event)
+        if len(self.top) == 0:
+            self.top.add(obstacle.Top_Alien(self.rng.choice(['right', 'left']), w))
+        self.timers.schedule('top_alien', self.rng.randint(40, 80))
 
     def collisions(self):
         """All the collisions in the game."""
-        if self.player.sprite.lasers:
-            for laser in self.player.sprite.lasers:
-                if pygame.sprite.spritecollide(laser, self.shields, True):
-                    laser.kill()
-
-                aliens_hit = pygame.sprite.spritecollide(laser, self.aliens, True)
-                if aliens_hit:
-                    for alien in aliens_hit:
-                        self.score += alien.value
-                        laser.kill()
-                        self.explosion_sound.play()
-                
-                if pygame.sprite.spritecollide(laser, self.top, True):
-                    laser.kill()
+        if self.lasers:
+            self.shoot_shields(laser.PLAYER)
+
+            points = self.shoot_aliens()
+            if points:
+                self.score += points
+                self.explosion_sound.play()
+
+            for top_alien in self.top:
+                shots = self.lasers.overlapping(laser.PLAYER, top_alien.rect)
+                if shots.size:
+                    self.lasers.kill(shots)
+                    top_alien.kill()
                     self.score +=500
 
-        if self.alien_lasers:
-            for laser in self.alien_lasers:
-                if pygame.sprite.spritecollide(laser, self.shields, True):
-                    laser.kill()
+            self.shoot_shields(laser.ALIEN)
 
-                if pygame.sprite.spritecollide(laser, self.player, False):
-                    laser.kill()
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        pygame.quit()
-                        sys.exit()
+            shots = self.lasers.overlapping(laser.ALIEN, self.player.sprite.rect)
+            if shots.size:
+                self.lasers.kill(shots)
+                self.lives -= shots.size
+                if self.lives <= 0:
+                    self.end_game()
 
         if self.aliens:
-            for alien in self.aliens:
-                pygame.sprite.spritecollide(alien, self.shields, True)
+            for alien in self.aliens.overlapping(self.shield_area):
+                self.hit_shields(self.aliens.rect(alien))
 
-                if pygame.sprite.spritecollide(alien, self.player, True):
-                    pygame.quit()
-                    sys.exit()
+            if self.aliens.overlapping(self.player.sprite.rect).size:
+                self.lives = 0
+                self.end_game()
 
     def display_lives(self):
         """Display the extra lives"""
         for live in range(self.lives - 1):
             x = self.live_x_start_pos + (live * (self.live_surf.get_size()[0] + 10))
-            self._screen.blit(self.live_surf,(x, 8))
+            self.blit(self.live_surf,(x, 8))
 
     def display_score(self):
         """Display the score."""
-        score_surface = self.font.render(f'score: {self.score}', False, 'white')
+        score_surface = assets.text('pixeled', 20, f'score: {self.score}', 'white', False)
         score_rect = score_surface.get_rect(topleft = (10,-10))
-        self._screen.blit(score_surface, score_rect)
+        self.blit(score_surface, score_rect)
 
     def start_scene(self):
-        """Start scene."""
+        """Start scene, resetting it first if a game was already played."""
+        if self.frames:
+            self.reset()
         super().start_scene()
         pygame.mixer.music.play(-1)
 
     def end_scene(self):
-        """End Scene."""
+        """End Scene, store the score and go back to the title once the game is over."""
         super().end_scene()
         pygame.mixer.music.stop()
-
-        scores = {'score': self.score, 'date': datetime.now()}
-        with open('scores.pickle', 'wb') as f:
-            pickle.dump(scores, f)
+        if self.score_store is not None and not self.replay:
+            self.score_store.add(self.score, seed=self.seed, frames=self.frames)
+        if self.game_over and self._scene_manager and not (self.replay or self.recorder):
+            self._scene_manager.set_next_scene('0')
+
+    def save_positions(self):
+        """Remember where every moving sprite was before this step."""
+        for group in (self.player, self.top):
+            for sprite in group:
+                sprite.previous_pos = sprite.rect.topleft
+        self.aliens.save_position()
+
+    def poll_controls(self):
+        """Return this step's controls from the replay, controller or keyboard."""
+        if self.replay:
+            return self.replay.read()
+        if self.controller:
+            controls = self.controller(self)
+        else:
+            controls = replay.keyboard_controls()
+        if self.recorder:
+            self.recorder.record(controls)
+        return controls
 
     def update_scene(self):
-        """Update Scene."""
-        self.player.update()
+        """Advance the battle by one fixed simulation step."""
+        if self.replay and self.replay.finished:
+            self._is_valid = False
+            return
+        if self.recorder:
+            self.recorder.keyframe(self)
+        self.frames += 1
+        self.save_positions()
+        controls = self.poll_controls()
+        self.player.update(controls)
+        self.clock.advance()
+        self.top.update()
+        self.aliens.update()
+        self.lasers.update()
+
+        self.collisions()
+        self.alien_pos()
 
         if len(self.aliens) == 0:
             self.end_game()
 
+    def snapshot(self):
+        """Return the simulation state of the battle as bytes for restore()."""
+        return snapshot.save(self)
+
+    def restore(self, data):
+        """Rewind or fast-forward the battle to a state returned by snapshot()."""
+        for bunker in snapshot.restore(self, data):
+            self._backdrop.blit(self._background, bunker.rect, bunker.rect)
+            self._backdrop.blit(bunker.image, bunker.rect)
+        self.invalidate()
+
     def end_game(self):
-        """End the game and exit."""
-        scores = {'score': self.score, 'date': datetime.now()}
-        with open('scores.pickle', 'wb') as f:
-            pickle.dump(scores, f)
-            
-        pygame.quit()
-        sys.exit()
+        """End the game; end_scene() saves the score once the loop leaves the scene."""
+        self.game_over = True
+        self._is_valid = False
+
+    def result(self):
+        """Return how the battle went as a dict."""
+        return {
+            'score': self.score,
+            'frames': self.frames,
+            'lives_lost': self.starting_lives - max(self.lives, 0),
+            'won': self.game_over and len(self.aliens) == 0,
+        }
+
+    def draw_interpolated(self, group):
+        """Draw a group between its previous and current positions."""
+        alpha = self.interpolation
+        for sprite in group:
+            (x, y) = sprite.rect.topleft
+            (prev_x, prev_y) = sprite.previous_pos
+            self.blit(
+                sprite.image,
+                (prev_x + (x - prev_x) * alpha, prev_y + (y - prev_y) * alpha),
+            )
 
     def draw(self):
         """Draw everything included."""
         super().draw()
-        self.top.update()
-        self.aliens.update(self.alien_direction)
-        self.alien_lasers.update()
-
-        self.collisions()
         self.display_lives()
         self.display_score()
-        self.alien_pos()
-        self.top_dog_alien()
 
-        self.shields.draw(self._screen)
-        self.aliens.draw(self._screen)
-        self.player.draw(self._screen)
-        self.player.sprite.lasers.draw(self._screen)
-        self.alien_lasers.draw(self._screen)
-        self.top.draw(self._screen)
+        self.blits(self.aliens.blit_sequence(self.interpolation))
+        self.draw_interpolated(self.player)
+        self.blits(self.lasers.blit_sequence(self.interpolation))
+        self.draw_interpolated(self.top)
+
+class ReplayViewer(Scene):
+    """Watch a replay.ReplayFile in a battle, with pause, stepping and seeking."""
+
+    def __init__(self, screen, battle, replay_file, frame=0):
+        super().__init__(screen)
+        self._battle = battle
+        self._replay = replay_file
+        self.paused = False
+        battle.replay = replay_file
+        self.seek(frame)
+
+    def seek(self, frame):
+        """Show the battle as it was at frame."""
+        self._replay.seek(self._battle, frame)
+
+    def process_event(self, event):
+        """Handle the playback keys."""
+        super().process_event(event)
+        if event.type != pygame.KEYDOWN:
+            return
+        frame = self._battle.frames
+        jump = 10 * self.tick_rate()
+        if event.key == pygame.K_SPACE:
+            self.paused = not self.paused
+        elif event.key == pygame.K_RIGHT:
+            self.paused = True
+            self.seek(frame + 1)
+        elif event.key == pygame.K_LEFT:
+            self.paused = True
+            self.seek(frame - 1)
+        elif event.key == pygame.K_PAGEUP:
+            self.seek(frame + jump)
+        elif event.key == pygame.K_PAGEDOWN:
+            self.seek(frame - jump)
+        elif event.key == pygame.K_HOME:
+            self.seek(0)
+        elif event.key == pygame.K_END:
+            self.seek(self._replay.frames)
+
+    def update_scene(self):
+        """Play one recorded frame unless paused or at the end."""
+        if not self.paused and not self._replay.finished:
+            self._battle.update_scene()
+
+    def draw(self):
+        """Draw the battle and where in the replay it is."""
+        self._battle.interpolation = 1.0 if self.paused else self.interpolation
+        self._battle.draw()
+        label = assets.text(
+            'pixeled', 12, f'frame {self._battle.frames} / {self._replay.frames}', 'white', False
+        )
+        (w, h) = self._screen.get_size()
+        self._battle.blit(label, label.get_rect(bottomright=(w - 10, h)))
+
+    def render_updates(self):
+        """Return the screen areas the battle changed."""
+        return self._battle.render_updates()
+
+    def start_scene(self):
+        """Start from a full redraw."""
+        self._battle.invalidate()
+
 
 class Title(PressAnyKeyToExitScene):
     """A scene with blinking text."""
@@ -357,12 +568,15 @@ class Title(PressAnyKeyToExitScene):
         self._t = 0.0
         self._delta_t = 0.01
 
-    def _interpolate(self):
-        """Rainbow Colors."""
-        # This can be done with pygame.Color.lerp
+    def update_scene(self):
+        """Advance the blinking animation by one simulation step."""
         self._t += self._delta_t
         if self._t > 1.0 or self._t < 0.0:
             self._delta_t *= -1
+
+    def _interpolate(self):
+        """Rainbow Colors."""
+        # This can be done with pygame.Color.lerp
         c = rgbcolors.sum_color(
             rgbcolors.mult_color(
                 (1.0 - self._t), self._message_complement_color
@@ -374,25 +588,18 @@ class Title(PressAnyKeyToExitScene):
     def draw(self):
         """Draw everything on the title screen."""
         super().draw()
-        #https://www.1001fonts.com/ : is where the font was aquired - 6-27-2023
-        presskey_font = pygame.font.Font(
-            "videogame/data/ARCADECLASSIC.TTF", self._size
-        )
-        presskey = presskey_font.render(
-            self._message, True, self._interpolate()
-        )
+        # The message is rasterized once in white and tinted every frame,
+        # which is far cheaper than rendering it again in each new color.
+        presskey = assets.text('arcade', self._size, self._message, rgbcolors.white).copy()
+        presskey.fill(self._interpolate(), special_flags=pygame.BLEND_RGB_MULT)
         (w, h) = self._screen.get_size()
         presskey_pos = presskey.get_rect(center=(w / 2, h / 2 - 50))
-        press_any_key_font = pygame.font.Font(
-            "videogame/data/ARCADECLASSIC.TTF", 15
+        press_any_key = assets.text(
+            'arcade', 15, 'Press  any  key  to  continue', rgbcolors.white
         )
-        press_any_key = press_any_key_font.render(
-            'Press  any  key  to  continue', True, rgbcolors.white
-        )
-        (w, h) = self._screen.get_size()
         press_any_key_pos = press_any_key.get_rect(center=(w / 2, h - 50))
-        self._screen.blit(presskey, presskey_pos)
-        self._screen.blit(press_any_key, press_any_key_pos)
+        self.blit(presskey, presskey_pos)
+        self.blit(press_any_key, press_any_key_pos)
 
     def start_scene(self):
         """Start scene."""
@@ -0,0 +1,102 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Keep every finished game's score in SQLite and answer leaderboard queries."""
+
+import pickle
+import sqlite3
+from datetime import datetime
+
+DEFAULT_PATH = 'scores.db'
+LEGACY_PATH = 'scores.pickle'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    day TEXT NOT NULL,
+    week TEXT NOT NULL,
+    seed INTEGER,
+    frames INTEGER
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_day ON scores (day, score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_by_week ON scores (week, score DESC, id);
+'''
+
+
+def day_key(date):
+    """Return the day a date or datetime falls on as YYYY-MM-DD."""
+    return date.strftime('%Y-%m-%d')
+
+
+def week_key(date):
+    """Return the ISO week a date or datetime falls in as YYYY-Www."""
+    (year, week, _) = date.isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+class ScoreStore:
+    """An append-only log of scores in an SQLite database."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        # Write-ahead logging makes each append one sequential write.
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(SCHEMA)
+
+    def is_empty(self):
+        """Return True if no game has been added yet."""
+        return self._db.execute('SELECT 1 FROM scores LIMIT 1').fetchone() is None
+
+    def add(self, score, date=None, seed=None, frames=None):
+        """Append a game's score, set at date (now by default)."""
+        date = date or datetime.now()
+        with self._db:
+            self._db.execute(
+                'INSERT INTO scores (score, date, day, week, seed, frames) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (score, date.isoformat(), day_key(date), week_key(date), seed, frames),
+            )
+
+    def top(self, k=10):
+        """Return the k best scores of all time, best first."""
+        return self._query('', (), k)
+
+    def top_of_day(self, date=None, k=10):
+        """Return the k best scores set on the day of date (today by default)."""
+        return self._query('WHERE day = ?', (day_key(date or datetime.now()),), k)
+
+    def top_of_week(self, date=None, k=10):
+        """Return the k best scores set in the ISO week of date (this week by default)."""
+        return self._query('WHERE week = ?', (week_key(date or datetime.now()),), k)
+
+    def _query(self, where, args, k):
+        rows = self._db.execute(
+            f'SELECT score, date, seed, frames FROM scores {where} '
+            'ORDER BY score DESC, id LIMIT ?',
+            (*args, k),
+        )
+        return [
+            {
+                'score': row['score'],
+                'date': datetime.fromisoformat(row['date']),
+                'seed': row['seed'],
+                'frames': row['frames'],
+            }
+            for row in rows
+        ]
+
+    def import_pickle(self, path=LEGACY_PATH):
+        """Append the {'score', 'date'} dict an older version pickled to path."""
+        with open(path, 'rb') as f:
+            scores = pickle.load(f)
+        self.add(scores['score'], scores['date'])
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
@@ -0,0 +1,104 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""The one simulation clock the game loop paces and every component reads."""
+
+import math
+import timers
+
+# Upper bound on simulation steps run to catch up after one slow frame,
+# at a time scale of 1.
+MAX_CATCH_UP_STEPS = 5
+MIN_TIME_SCALE = 1 / 16
+MAX_TIME_SCALE = 16
+
+
+class SimClock:
+    """Simulation time counted in fixed steps, with the timer wheel they advance."""
+
+    def __init__(self, tick_rate=60):
+        self.timers = timers.TimerWheel()
+        self.tick_rate = tick_rate
+        self.time_scale = 1.0
+        self.paused = False
+        self.fast_forward = False
+        self._accumulator = 0.0
+        self._single_steps = 0
+
+    @property
+    def ticks(self):
+        """Number of simulation steps taken."""
+        return self.timers.tick
+
+    @property
+    def seconds(self):
+        """Simulated seconds since the clock started."""
+        return self.ticks / self.tick_rate
+
+    @property
+    def step_ms(self):
+        """Simulated milliseconds in one step."""
+        return 1000.0 / self.tick_rate
+
+    @property
+    def interpolation(self):
+        """How far, from 0 to 1, wall-clock time is past the last step."""
+        if self.paused or self.fast_forward:
+            return 1.0
+        return self._accumulator / self.step_ms
+
+    @property
+    def uncapped(self):
+        """True while fast-forwarding and not paused, when steps are not paced."""
+        return self.fast_forward and not self.paused
+
+    def advance(self):
+        """Take one simulation step, running every timer due on it."""
+        self.timers.advance()
+
+    def start(self, tick_rate):
+        """Pace a new scene that runs tick_rate steps per simulated second."""
+        self.tick_rate = tick_rate
+        self._accumulator = 0.0
+
+    def accumulate(self, delta_ms):
+        """Add delta_ms of wall-clock time, scaled by time_scale, to simulate."""
+        if self.paused or self.fast_forward:
+            return
+        limit = self.step_ms * self.max_steps()
+        self._accumulator += min(delta_ms * self.time_scale, limit)
+
+    def max_steps(self):
+        """Most steps run in one frame before the game is allowed to slow down."""
+        return max(1, math.ceil(MAX_CATCH_UP_STEPS * self.time_scale))
+
+    def steps_due(self):
+        """Return how many steps to run now and take their time off the accumulator."""
+        if self.paused:
+            (steps, self._single_steps) = (self._single_steps, 0)
+            return steps
+        steps = min(int(self._accumulator // self.step_ms), self.max_steps())
+        self._accumulator -= steps * self.step_ms
+        if steps == self.max_steps():
+            self._accumulator %= self.step_ms
+        return steps
+
+    def toggle_pause(self):
+        """Pause or resume."""
+        self.paused = not self.paused
+        self._accumulator = 0.0
+
+    def single_step(self):
+        """While paused, run exactly one more step."""
+        if self.paused:
+            self._single_steps += 1
+
+    def scale(self, factor):
+        """Multiply time_scale by factor, kept between 1/16 and 16."""
+        self.time_scale = min(max(self.time_scale * factor, MIN_TIME_SCALE), MAX_TIME_SCALE)
+
+    def toggle_fast_forward(self):
+        """Switch between paced play and simulating as fast as possible."""
+        self.fast_forward = not self.fast_forward
+        self._accumulator = 0.0
@@ -0,0 +1,119 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""Save a BattleScene's whole simulation state to bytes and put it back."""
+
+# Whether the scene is still valid is part of the state being saved.
+# pylint: disable=protected-access
+
+import array
+import numpy as np
+import laser
+import obstacle
+
+SCALARS = 21
+RNG_WORDS = 625
+TOP_FIELDS = 5
+TIMER_FIELDS = 4
+
+
+def save(battle):
+    """Return the simulation state of battle as one bytes object."""
+    player = battle.player.sprite
+    aliens = battle.aliens
+    lasers = battle.lasers
+    free_slots = lasers.free_slots()
+    top = battle.top.sprites()
+    (tick, sequence, pending) = battle.timers.state()
+    scalars = np.array([
+        battle.frames, battle.score, battle.lives, battle.game_over, battle.is_valid(),
+        tick, sequence,
+        player.rect.x, player.rect.y, player.previous_pos[0], player.previous_pos[1],
+        player.ready, len(pending),
+        aliens.origin[0], aliens.origin[1],
+        aliens.previous_origin[0], aliens.previous_origin[1], aliens.direction,
+        len(lasers.alive), len(free_slots), len(top),
+    ], dtype=np.int64)
+    parts = [
+        scalars.tobytes(),
+        array.array('I', battle.rng.getstate()[1]).tobytes(),
+        np.array(pending, dtype=np.int64).tobytes(),
+        aliens.alive.tobytes(),
+    ]
+    parts.extend(bunker.blocks.tobytes() for bunker in battle.shields)
+    parts.extend(getattr(lasers, name).tobytes() for name in laser.FIELDS)
+    parts.append(free_slots.tobytes())
+    parts.append(np.array(
+        [(t.rect.x, t.rect.y, t.previous_pos[0], t.previous_pos[1], t.speed) for t in top],
+        dtype=np.int32,
+    ).tobytes())
+    return b''.join(parts)
+
+
+def restore(battle, data):
+    """Put battle back in the state save() returned data for."""
+    offset = 0
+
+    def take(dtype, count):
+        nonlocal offset
+        values = np.frombuffer(data, dtype, count, offset)
+        offset += values.nbytes
+        return values
+
+    (
+        battle.frames, battle.score, battle.lives, game_over, is_valid,
+        tick, sequence,
+        player_x, player_y, previous_x, previous_y, ready, timer_count,
+        origin_x, origin_y, previous_origin_x, previous_origin_y, direction,
+        capacity, free_count, top_count,
+    ) = take(np.int64, SCALARS).tolist()
+    aliens = battle.aliens
+    lasers = battle.lasers
+    expected = (
+        offset + 4 * RNG_WORDS + 8 * TIMER_FIELDS * timer_count + aliens.alive.size
+        + sum(bunker.blocks.size for bunker in battle.shields)
+        + capacity * sum(getattr(lasers, name).itemsize for name in laser.FIELDS)
+        + 4 * free_count + 4 * TOP_FIELDS * top_count
+    )
+    if len(data) != expected:
+        raise ValueError(
+            f'snapshot of {len(data)} bytes does not fit a battle of {aliens.alive.size} aliens'
+        )
+    battle.game_over = bool(game_over)
+    battle._is_valid = bool(is_valid)
+    battle.rng.setstate((3, tuple(array.array('I', take(np.uint32, RNG_WORDS))), None))
+    pending = take(np.int64, timer_count * TIMER_FIELDS).reshape(-1, TIMER_FIELDS)
+    restored = battle.timers.set_state(tick, sequence, pending.tolist())
+
+    player = battle.player.sprite
+    player.rect.topleft = (player_x, player_y)
+    player.previous_pos = (previous_x, previous_y)
+    player.ready = bool(ready)
+    player.cooldown_timer = restored.get('player_ready')
+
+    aliens.origin[:] = (origin_x, origin_y)
+    aliens.previous_origin[:] = (previous_origin_x, previous_origin_y)
+    aliens.direction = direction
+    aliens.alive[:] = take(bool, len(aliens.alive))
+
+    changed = []
+    for bunker in battle.shields:
+        blocks = take(bool, bunker.blocks.size).reshape(bunker.blocks.shape)
+        if bunker.set_blocks(blocks):
+            changed.append(bunker)
+
+    arrays = [take(getattr(lasers, name).dtype, capacity) for name in laser.FIELDS]
+    lasers.set_state(arrays, take(np.int32, free_count))
+
+    battle.top.empty()
+    width = player.max_x_border
+    for (x, y, previous_x, previous_y, speed) in take(
+        np.int32, top_count * TOP_FIELDS
+    ).reshape(-1, TOP_FIELDS).tolist():
+        top_alien = obstacle.Top_Alien('left', width)
+        top_alien.rect.topleft = (x, y)
+        top_alien.previous_pos = (previous_x, previous_y)
+        top_alien.speed = speed
+        battle.top.add(top_alien)
+    return changed
@@ -0,0 +1,121 @@
+# Brandon Nguyen
+# nguyen.bradon771@csu.fullerton.edu
+# @brandonnguyenr
+
+"""A hierarchical timer wheel that runs callbacks on simulation ticks."""
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+LEVELS = 4
+
+
+class Timer:
+    """One scheduled callback; keep it to cancel() it later."""
+
+    __slots__ = ('name', 'due', 'interval', 'sequence', 'cancelled')
+
+    def __init__(self, name, due, interval, sequence):
+        self.name = name
+        self.due = due
+        self.interval = interval
+        self.sequence = sequence
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Callbacks scheduled in simulation ticks, fired in scheduling order on a timing wheel."""
+
+    def __init__(self):
+        self.tick = 0
+        self._sequence = 0
+        self._callbacks = {}
+        self._names = []
+        self._wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+
+    def register(self, name, callback):
+        """Make name run callback(), with no arguments, when its timers fire."""
+        if name not in self._callbacks:
+            self._names.append(name)
+        self._callbacks[name] = callback
+
+    def schedule(self, name, delay, interval=None):
+        """Fire name's callback delay ticks from now, then every interval ticks if given."""
+        if delay < 1:
+            raise ValueError('timers fire at least one tick from now')
+        self._sequence += 1
+        timer = Timer(name, self.tick + delay, interval, self._sequence)
+        self._place(timer)
+        return timer
+
+    def cancel(self, timer):
+        """Stop timer from firing; cancelling twice is harmless."""
+        timer.cancelled = True
+
+    def _place(self, timer):
+        remaining = timer.due - self.tick
+        for level in range(LEVELS):
+            if remaining < SLOTS << (SLOT_BITS * level):
+                slot = (timer.due >> (SLOT_BITS * level)) & (SLOTS - 1)
+                self._wheels[level][slot].append(timer)
+                return
+        raise ValueError(f'timers cannot be scheduled {remaining} ticks ahead')
+
+    def _cascade(self):
+        for level in range(1, LEVELS):
+            if self.tick & ((1 << (SLOT_BITS * level)) - 1):
+                return
+            wheel = self._wheels[level]
+            slot = (self.tick >> (SLOT_BITS * level)) & (SLOTS - 1)
+            (timers, wheel[slot]) = (wheel[slot], [])
+            for timer in timers:
+                if not timer.cancelled:
+                    self._place(timer)
+
+    def advance(self):
+        """Move on one tick and run every callback due on it."""
+        self.tick += 1
+        self._cascade()
+        wheel = self._wheels[0]
+        slot = self.tick & (SLOTS - 1)
+        (due, wheel[slot]) = (wheel[slot], [])
+        if len(due) > 1:
+            due.sort(key=lambda timer: timer.sequence)
+        for timer in due:
+            if timer.cancelled:
+                continue
+            if timer.interval:
+                self._sequence += 1
+                timer.due += timer.interval
+                timer.sequence = self._sequence
+                self._place(timer)
+            self._callbacks[timer.name]()
+
+    def pending(self):
+        """Return every timer still to fire, in the order they were scheduled."""
+        timers = [
+            timer for wheel in self._wheels for slot in wheel for timer in slot
+            if not timer.cancelled
+        ]
+        timers.sort(key=lambda timer: timer.sequence)
+        return timers
+
+    def state(self):
+        """Return (tick, sequence, [(name index, due, interval, sequence)]) for set_state()."""
+        index = {name: number for (number, name) in enumerate(self._names)}
+        return (self.tick, self._sequence, [
+            (index[timer.name], timer.due, timer.interval or 0, timer.sequence)
+            for timer in self.pending()
+        ])
+
+    def set_state(self, tick, sequence, timers):
+        """Replace every timer with ones saved by state(); return them by name."""
+        self.tick = tick
+        self._sequence = sequence
+        self._wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        restored = {}
+        for (name_index, due, interval, timer_sequence) in timers:
+            name = self._names[name_index]
+            timer = Timer(name, due, interval or None, timer_sequence)
+            self._place(timer)
+            restored[name] = timer
+        return restored